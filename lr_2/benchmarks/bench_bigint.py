@@ -0,0 +1,44 @@
+"""Big int benchmark.
+
+This script measures the time myserializer.packer.Packer spends packing
+and unpacking ints of 10 thousand to 1 million decimal digits.
+For reference, it also measures decimal str conversion, which
+the packer used before (the int max str digits limit is lifted for it).
+
+Usage:
+    python benchmarks/bench_bigint.py [-r REPEAT] [--decimal-max DIGITS]
+"""
+import argparse
+import random
+import sys
+import timeit
+
+from myserializer.packer import Packer
+
+_BITS_PER_DIGIT = 3.3219280948873626
+
+
+def main(argv=None):
+    """Run the benchmark and print round-trip times."""
+    parser = argparse.ArgumentParser(description='Benchmark big ints.')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of timed repetitions')
+    parser.add_argument('--decimal-max', type=int, default=100_000,
+                        help='largest number of digits to time decimal '
+                        'conversion for')
+    args = parser.parse_args(argv)
+
+    sys.set_int_max_str_digits(0)
+    packer = Packer()
+    for digits in (10_000, 100_000, 1_000_000):
+        value = random.getrandbits(int(digits * _BITS_PER_DIGIT)) | 1
+        runs = [('packer', lambda: packer.unpack(packer.pack(value)))]
+        if digits <= args.decimal_max:
+            runs.append(('decimal', lambda: int(str(value))))
+        for name, run in runs:
+            best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+            print(f'{digits:>9} digits {name:>7}: {best:.4f} s')
+
+
+if __name__ == '__main__':
+    main()
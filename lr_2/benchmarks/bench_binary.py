@@ -0,0 +1,62 @@
+"""Binary format benchmark.
+
+This script compares myserializer.my_binary.BinarySerializer with
+myserializer.my_json.JsonSerializer (tagged and plain): the size of
+serialized data and the time of dumps and loads.
+
+The payloads are many flat records, numeric data (lists of floats
+and ints too short for typed arrays) and blobs of bytes.
+
+Usage:
+    python benchmarks/bench_binary.py [-n RECORDS] [-r REPEAT]
+"""
+import argparse
+import timeit
+
+from myserializer.my_binary import BinarySerializer
+from myserializer.my_json import JsonSerializer
+
+
+def _records_payload(size: int) -> list:
+    return [{'id': i, 'name': f'user{i}', 'tags': ('a', 'b\n'),
+             'score': i / 7, 'active': bool(i % 2), 'note': 'x' * 40}
+            for i in range(size)]
+
+
+def _numbers_payload(size: int) -> list:
+    return [[i / 3, i * 1000, -i, float(i)] for i in range(size * 2)]
+
+
+def _blobs_payload(size: int) -> list:
+    return [bytes(range(256)) * 4 for _ in range(size // 10)]
+
+
+def main(argv=None):
+    """Run the benchmark and print sizes and round-trip times."""
+    parser = argparse.ArgumentParser(description='Benchmark binary format.')
+    parser.add_argument('-n', '--records', type=int, default=10_000,
+                        help='number of records in the payload')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of timed repetitions')
+    args = parser.parse_args(argv)
+
+    serializers = (('json', JsonSerializer()),
+                   ('json plain', JsonSerializer(plain=True)),
+                   ('binary', BinarySerializer()))
+    for payload, make_payload in (('records', _records_payload),
+                                  ('numbers', _numbers_payload),
+                                  ('blobs', _blobs_payload)):
+        obj = make_payload(args.records)
+        for name, serializer in serializers:
+            data = serializer.dumps(obj)
+            assert serializer.loads(data) == obj
+            dump = min(timeit.repeat(lambda: serializer.dumps(obj),
+                                     number=1, repeat=args.repeat))
+            load = min(timeit.repeat(lambda: serializer.loads(data),
+                                     number=1, repeat=args.repeat))
+            print(f'{payload:>8} {name:>10}: {len(data) / 2 ** 20:6.2f} MiB, '
+                  f'dumps {dump:.3f} s, loads {load:.3f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Compression benchmark.
+
+This script measures the size of serialized records and the time
+of dumps and loads with myserializer.compression.CompressedSerializer
+wrapping JsonSerializer and BinarySerializer, with each compression
+and without it.
+
+Usage:
+    python benchmarks/bench_compression.py [-n RECORDS] [-r REPEAT]
+"""
+import argparse
+import timeit
+
+from myserializer import create_serializer
+from myserializer.compression import COMPRESSIONS
+
+
+def _records_payload(size: int) -> list:
+    return [{'id': i, 'name': f'user{i}', 'tags': ('a', 'b\n'),
+             'score': i / 7, 'active': bool(i % 2), 'note': 'x' * 40}
+            for i in range(size)]
+
+
+def main(argv=None):
+    """Run the benchmark and print sizes and round-trip times."""
+    parser = argparse.ArgumentParser(description='Benchmark compression.')
+    parser.add_argument('-n', '--records', type=int, default=10_000,
+                        help='number of records in the payload')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of timed repetitions')
+    args = parser.parse_args(argv)
+
+    obj = _records_payload(args.records)
+    for serializer_type in ('json', 'binary'):
+        for compression in (None, *COMPRESSIONS):
+            serializer = create_serializer(serializer_type, compression)
+            data = serializer.dumps(obj)
+            assert serializer.loads(data) == obj
+            dump = min(timeit.repeat(lambda: serializer.dumps(obj),
+                                     number=1, repeat=args.repeat))
+            load = min(timeit.repeat(lambda: serializer.loads(data),
+                                     number=1, repeat=args.repeat))
+            print(f'{serializer_type:>6} {compression or "none":>4}: '
+                  f'{len(data) / 2 ** 20:6.3f} MiB, '
+                  f'dumps {dump:.3f} s, loads {load:.3f} s')
+
+
+if __name__ == '__main__':
+    main()
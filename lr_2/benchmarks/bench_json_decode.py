@@ -0,0 +1,72 @@
+"""JSON decoding benchmark.
+
+This script measures the time myserializer.my_json.decoder.JsonDecoder
+spends decoding multi-megabyte JSON documents, both from str
+and from a text file, and compares it with json.loads.
+
+The documents are packed forms (as JsonSerializer writes them)
+of many flat records and of long texts.
+
+Usage:
+    python benchmarks/bench_json_decode.py [-n RECORDS] [-r REPEAT]
+"""
+import argparse
+import json
+import os
+import tempfile
+import timeit
+
+from myserializer.my_json.decoder import JsonDecoder
+from myserializer.my_json.encoder import JsonEncoder
+from myserializer.packer import Packer
+
+
+def _records_payload(size: int) -> list:
+    return [{'id': i, 'name': f'user{i}', 'tags': ('a', 'b\n'),
+             'score': i / 7, 'active': bool(i % 2), 'note': 'x' * 40}
+            for i in range(size)]
+
+
+def _texts_payload(size: int) -> list:
+    line = 'Lorem ipsum dolor sit amet, "consectetur" adipiscing elit.\n'
+    return [f'{i}: {line * 100}' for i in range(size // 10)]
+
+
+def main(argv=None):
+    """Run the benchmark and print decoding times."""
+    parser = argparse.ArgumentParser(description='Benchmark JsonDecoder.')
+    parser.add_argument('-n', '--records', type=int, default=10_000,
+                        help='number of records in the document')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of timed repetitions')
+    args = parser.parse_args(argv)
+
+    decoder = JsonDecoder()
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'payload.json')
+
+    def decode_file():
+        with open(path, encoding='utf-8') as file:
+            return decoder.decode(file)
+
+    try:
+        for payload, make_payload in (('records', _records_payload),
+                                      ('texts', _texts_payload)):
+            packed = Packer().pack(make_payload(args.records))
+            text = JsonEncoder().encode(packed)
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(text)
+            for name, run in (('str', lambda: decoder.decode(text)),
+                              ('file', decode_file),
+                              ('json', lambda: json.loads(text))):
+                best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+                print(f'{payload:>8} {name:>4}: '
+                      f'{len(text) / 2 ** 20:.1f} MiB, {best:.3f} s, '
+                      f'{len(text) / best / 2 ** 20:.1f} MiB/s')
+    finally:
+        os.remove(path)
+        os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main()
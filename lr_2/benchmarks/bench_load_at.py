@@ -0,0 +1,55 @@
+"""Selective load benchmark.
+
+This script measures the time myserializer.my_json.JsonSerializer
+spends loading one field of a big serialized dict: with load and
+indexing, and with load_at, which skips the other items. The field is
+the last one, so load_at has to skip the whole dict.
+
+Usage:
+    python benchmarks/bench_load_at.py [-n ITEMS] [-r REPEAT] [--plain]
+"""
+import argparse
+import io
+import timeit
+
+from myserializer.my_json import JsonSerializer
+
+
+def _payload(size: int) -> dict:
+    return {f'key{i}': {'id': i, 'values': [i / 3, str(i), None],
+                        'note': 'x' * 40}
+            for i in range(size)}
+
+
+def main(argv=None):
+    """Run the benchmark and print loading times."""
+    parser = argparse.ArgumentParser(description='Benchmark load_at.')
+    parser.add_argument('-n', '--items', type=int, default=20_000,
+                        help='number of dict items')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of timed repetitions')
+    parser.add_argument('--plain', action='store_true',
+                        help='serialize in plain mode')
+    args = parser.parse_args(argv)
+
+    serializer = JsonSerializer(plain=args.plain)
+    text = serializer.dumps(_payload(args.items))
+    path = (f'key{args.items - 1}', 'values', 1)
+
+    def load():
+        obj = serializer.load(io.StringIO(text))
+        for key in path:
+            obj = obj[key]
+        return obj
+
+    def load_at():
+        return serializer.load_at(io.StringIO(text), path)
+
+    assert load() == load_at()
+    for name, run in (('load', load), ('load_at', load_at)):
+        best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+        print(f'{name:>8}: {len(text) / 2 ** 20:.1f} MiB, {best:.3f} s')
+
+
+if __name__ == '__main__':
+    main()
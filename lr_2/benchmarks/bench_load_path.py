@@ -0,0 +1,96 @@
+"""File load benchmark.
+
+This script measures the time and the peak memory
+myserializer.my_json.JsonSerializer needs to load a big file of strs:
+with load_path, which decodes the memory-mapped file, and with loads
+of open().read(), which reads the whole text into a str first.
+For reference, load of the opened text file is measured too.
+
+Each variant runs in its own process, so that peak memory (ru_maxrss)
+is not shared; this needs the resource module (Unix).
+
+Usage:
+    python benchmarks/bench_load_path.py [-m MEGABYTES] [--keep FILE]
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from myserializer.my_json import JsonSerializer
+
+_ITEM = 'x' * 1000
+
+
+def _load_path(serializer: JsonSerializer, path: str):
+    return serializer.load_path(path)
+
+
+def _loads_read(serializer: JsonSerializer, path: str):
+    with open(path, encoding='utf-8') as file:
+        return serializer.loads(file.read())
+
+
+def _load(serializer: JsonSerializer, path: str):
+    with open(path, encoding='utf-8') as file:
+        return serializer.load(file)
+
+
+_VARIANTS = {
+    'load_path': _load_path,
+    'loads(read())': _loads_read,
+    'load': _load
+}
+
+
+def _write_payload(path: str, megabytes: int) -> None:
+    # The list refers to the same str, so it is small until loaded.
+    items = [_ITEM] * (megabytes * 2 ** 20 // (len(_ITEM) + 3))
+    with open(path, 'w', encoding='utf-8') as file:
+        JsonSerializer(plain=True).dump(items, file)
+
+
+def _run_variant(name: str, path: str) -> None:
+    start = time.perf_counter()
+    obj = _VARIANTS[name](JsonSerializer(plain=True), path)
+    elapsed = time.perf_counter() - start
+    assert len(obj) and obj[-1] == _ITEM
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f'{name:>13}: {elapsed:.3f} s, peak {peak:.0f} MiB')
+
+
+def main(argv=None):
+    """Write the file, then run each variant in a subprocess."""
+    parser = argparse.ArgumentParser(description='Benchmark load_path.')
+    parser.add_argument('-m', '--megabytes', type=int, default=64,
+                        help='file size in MiB (1024 for 1 GiB)')
+    parser.add_argument('--keep', metavar='FILE',
+                        help='use (write if missing) this file')
+    parser.add_argument('--variant', choices=_VARIANTS,
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.variant:
+        _run_variant(args.variant, args.keep)
+        return
+    path = args.keep
+    if path is None:
+        fd, path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+    try:
+        if not args.keep or not os.path.exists(path):
+            _write_payload(path, args.megabytes)
+        print(f'file: {os.path.getsize(path) / 2 ** 20:.0f} MiB')
+        for name in _VARIANTS:
+            subprocess.run([sys.executable, __file__, '--variant', name,
+                            '--keep', path], check=True)
+    finally:
+        if not args.keep:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""Packer benchmark.
+
+This script measures the time myserializer.packer.Packer spends
+per value packing and unpacking a payload made of many small scalars,
+a payload of flat records, a payload of deeply nested lists,
+a list referencing one dict many times and a payload of long lists
+of numbers.
+
+Values are counted in the payload (each dict key and value, and each item
+of other containers), so time per value can be compared between modes
+and node formats.
+
+Usage:
+    python benchmarks/bench_packer.py [-n VALUES] [-r REPEAT] [--plain]
+"""
+import argparse
+import timeit
+
+from myserializer.packer import Packer
+
+
+def _scalars_payload(size: int) -> list:
+    values = [42, -7, 3.5, 'name', True, False, None, 2 ** 40]
+    return [values[i % len(values)] for i in range(size)]
+
+
+def _records_payload(size: int) -> list:
+    return [{'id': i, 'name': f'user{i}', 'tags': ('a', 'b'),
+             'score': i / 7, 'active': bool(i % 2)}
+            for i in range(size // 12)]
+
+
+def _nested_payload(size: int, depth: int = 400) -> list:
+    chains = []
+    for chain in range(size // (depth * 5)):
+        value: list = [chain]
+        for level in range(depth):
+            value = [value, (level,), {'level': level}]
+        chains.append(value)
+    return chains
+
+
+def _shared_payload(size: int) -> list:
+    shared = {str(i): list(range(20)) for i in range(50)}
+    return [shared] * (size // 1000)
+
+
+def _numeric_payload(size: int) -> list:
+    return [list(range(1000)) if i % 2 else [j / 3 for j in range(1000)]
+            for i in range(size // 1000)]
+
+
+def _count_values(value) -> int:
+    count = 0
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        count += 1
+        if type(value) is dict:
+            count += len(value)
+            stack.extend(value.values())
+        elif type(value) in (list, tuple, set, frozenset):
+            stack.extend(value)
+    return count
+
+
+def main(argv=None):
+    """Run the benchmark and print time per value."""
+    parser = argparse.ArgumentParser(description='Benchmark Packer.')
+    parser.add_argument('-n', '--values', type=int, default=200_000,
+                        help='approximate number of values per payload')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='number of timed repetitions')
+    parser.add_argument('--plain', action='store_true',
+                        help='pack in plain mode')
+    args = parser.parse_args(argv)
+
+    packer = Packer(plain=args.plain)
+    for name, payload in (('scalars', _scalars_payload(args.values)),
+                          ('records', _records_payload(args.values)),
+                          ('nested', _nested_payload(args.values)),
+                          ('shared', _shared_payload(args.values)),
+                          ('numeric', _numeric_payload(args.values))):
+        values = _count_values(payload)
+        packed = packer.pack(payload)
+        for action, run in (('pack', lambda: packer.pack(payload)),
+                            ('unpack', lambda: packer.unpack(packed))):
+            best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+            print(f'{name:>8} {action:>6}: {values} values, {best:.3f} s, '
+                  f'{best / values * 1e9:.0f} ns/value')
+
+
+if __name__ == '__main__':
+    main()
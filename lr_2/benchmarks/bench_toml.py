@@ -0,0 +1,61 @@
+"""TOML format benchmark.
+
+This script compares myserializer.my_toml.TomlSerializer with
+the toml package writing and parsing the same packed objects
+(nested table headers): the size of serialized data and the time
+of dumps and loads.
+
+The payloads are the basic serialization test inputs repeated
+and many flat records.
+
+Usage:
+    python benchmarks/bench_toml.py [-n RECORDS] [-r REPEAT]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+import toml
+from myserializer.my_toml import TomlSerializer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tests'))
+from serialization_inputs import test_basic  # noqa: E402
+
+
+def _records_payload(size: int) -> list:
+    return [{'id': i, 'name': f'user{i}', 'tags': ('a', 'b'),
+             'score': i / 7, 'active': bool(i % 2)}
+            for i in range(size)]
+
+
+def main(argv=None):
+    """Run the benchmark and print sizes and round-trip times."""
+    parser = argparse.ArgumentParser(description='Benchmark TOML format.')
+    parser.add_argument('-n', '--records', type=int, default=2_000,
+                        help='number of records in the payload')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of timed repetitions')
+    args = parser.parse_args(argv)
+
+    serializer = TomlSerializer()
+    packer = serializer.packer
+    toml_lib = (lambda obj: toml.dumps(packer.pack(obj)),
+                lambda s: packer.unpack(toml.loads(s)))
+    flat = (serializer.dumps, serializer.loads)
+    for payload, obj in (('basic', test_basic * 20),
+                         ('records', _records_payload(args.records))):
+        for name, (dumps, loads) in (('toml lib', toml_lib),
+                                     ('flat', flat)):
+            data = dumps(obj)
+            assert loads(data) == obj
+            dump = min(timeit.repeat(lambda: dumps(obj),
+                                     number=1, repeat=args.repeat))
+            load = min(timeit.repeat(lambda: loads(data),
+                                     number=1, repeat=args.repeat))
+            print(f'{payload:>8} {name:>8}: {len(data) / 2 ** 10:8.1f} KiB, '
+                  f'dumps {dump:.3f} s, loads {load:.3f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""YAML benchmark.
+
+This script measures the time myserializer.my_yaml.YamlSerializer
+spends on dumps and loads of many flat records in each flow style,
+and compares it with the pure Python SafeDumper and SafeLoader,
+which the serializer used before LibYAML.
+
+Usage:
+    python benchmarks/bench_yaml.py [-n RECORDS] [-r REPEAT]
+"""
+import argparse
+import timeit
+
+import yaml
+from myserializer.my_yaml import YamlSerializer
+from myserializer.packer import ConstantNode
+
+
+class _PyDumper(yaml.SafeDumper):
+    def ignore_aliases(self, data) -> bool:
+        return type(data) is ConstantNode or super().ignore_aliases(data)
+
+
+_PyDumper.add_representer(ConstantNode, _PyDumper.represent_dict)
+
+
+def _records_payload(size: int) -> list:
+    return [{'id': i, 'name': f'user{i}', 'tags': ('a', 'b\n'),
+             'score': i / 7, 'active': bool(i % 2), 'note': 'x' * 40}
+            for i in range(size)]
+
+
+def main(argv=None):
+    """Run the benchmark and print sizes and round-trip times."""
+    parser = argparse.ArgumentParser(description='Benchmark YAML.')
+    parser.add_argument('-n', '--records', type=int, default=2_000,
+                        help='number of records in the payload')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of timed repetitions')
+    args = parser.parse_args(argv)
+
+    obj = _records_payload(args.records)
+    serializer = YamlSerializer()
+    packer = serializer.packer
+
+    def py_dumps():
+        return yaml.dump(packer.pack(obj), Dumper=_PyDumper)
+
+    text = py_dumps()
+    runs = [('python', py_dumps,
+             lambda: packer.unpack(yaml.safe_load(text)), text)]
+    for flow_style in (False, None, True):
+        flow_serializer = YamlSerializer(flow_style=flow_style)
+        flow_text = flow_serializer.dumps(obj)
+        runs.append((f'libyaml flow={flow_style}',
+                     lambda s=flow_serializer: s.dumps(obj),
+                     lambda s=flow_serializer, t=flow_text: s.loads(t),
+                     flow_text))
+    for name, dumps, loads, text in runs:
+        assert loads() == obj
+        dump = min(timeit.repeat(dumps, number=1, repeat=args.repeat))
+        load = min(timeit.repeat(loads, number=1, repeat=args.repeat))
+        print(f'{name:>19}: {len(text) / 2 ** 20:.2f} MiB, '
+              f'dumps {dump:.3f} s, loads {load:.3f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,36 +1,135 @@
 """MySerializer module.
 
 This module can serialize and deserialize objects to (from)
-string or TextIO in different serialization formats.
+string or TextIO (bytes or BinaryIO) in different serialization formats.
 
-If imported as module, the method create_serializer is available.
+If imported as module, the methods create_serializer and
+register_serializer are available.
+
+Format modules (and their backends, such as yaml and toml) are imported
+on the first use of the format, so importing this module is cheap.
+Other packages can provide formats through entry points of the group
+ENTRY_POINT_GROUP, e.g. in setup.py:
+
+    entry_points={'myserializer.serializers': [
+        'xml = myxml:XmlSerializer']}
 """
-from myserializer.my_json import JsonSerializer
-from myserializer.my_toml import TomlSerializer
-from myserializer.my_yaml import YamlSerializer
-from myserializer.serializer import Serializer
+import importlib
+import sys
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Dict
+
+    from myserializer.serializer import Serializer
+
+ENTRY_POINT_GROUP = 'myserializer.serializers'
+"""Entry point group of serializer types provided by other packages."""
+
+_SERIALIZERS: 'Dict[str, str | Callable[[], Serializer]]' = {
+    'json': 'myserializer.my_json:JsonSerializer',
+    'yaml': 'myserializer.my_yaml:YamlSerializer',
+    'toml': 'myserializer.my_toml:TomlSerializer',
+    'binary': 'myserializer.my_binary:BinarySerializer',
+}
+"""Maps serializer types to serializer factories or to 'module:name'
+paths of factories, which are imported on first use."""
 
+_EXPORTS = {
+    'Serializer': 'myserializer.serializer:Serializer',
+    'JsonSerializer': 'myserializer.my_json:JsonSerializer',
+    'YamlSerializer': 'myserializer.my_yaml:YamlSerializer',
+    'TomlSerializer': 'myserializer.my_toml:TomlSerializer',
+    'BinarySerializer': 'myserializer.my_binary:BinarySerializer',
+    'CompressedSerializer': 'myserializer.compression:CompressedSerializer',
+}
+"""Paths of classes available as attributes of this module."""
+
+_entry_points_loaded = False
+
+
+def register_serializer(serializer_type: str,
+                        factory: 'str | Callable[[], Serializer]') -> None:
+    """Register a serializer type for create_serializer.
+
+    Args:
+        serializer_type (str): serializer type, case-insensitive;
+        a registered type is replaced.
+        factory (str | callable): a callable creating the serializer
+        (such as a Serializer subclass) or its 'module:name' path,
+        which is imported on the first use of the type.
+    """
+    _SERIALIZERS[serializer_type.lower()] = factory
 
-def create_serializer(serializer_type: str) -> Serializer:
+
+def create_serializer(serializer_type: str,
+                      compression: 'str | None' = None) -> 'Serializer':
     """Create serializer of specific type.
 
     Supported serializer types:
     - json;
     - yaml;
-    - toml.
+    - toml;
+    - binary;
+    - types added by register_serializer and entry points.
 
     Args:
         serializer_type (str): serializer type, case-insensitive.
+        compression (str, optional): if specified, the serializer
+        is wrapped into CompressedSerializer with this compression:
+        'gzip', 'bz2' or 'lzma'.
+
+    Raises:
+        NotImplementedError: if the serializer type is unknown.
+        ValueError: if the compression is unknown.
 
     Returns:
         instance of class Serializer.
     """
     serializer_type = serializer_type.lower()
-    if serializer_type == 'json':
-        return JsonSerializer()
-    elif serializer_type == 'yaml':
-        return YamlSerializer()
-    elif serializer_type == 'toml':
-        return TomlSerializer()
-    else:
+    if serializer_type not in _SERIALIZERS:
+        _load_entry_points()
+    factory = _SERIALIZERS.get(serializer_type)
+    if factory is None:
         raise NotImplementedError('Unknown serializer type')
+    if isinstance(factory, str):
+        factory = _SERIALIZERS[serializer_type] = _import(factory)
+    serializer = factory()
+    if compression is not None:
+        from myserializer.compression import CompressedSerializer
+        serializer = CompressedSerializer(serializer, compression)
+    return serializer
+
+
+def _import(path: str):
+    """Import object by its 'module:name' path."""
+    module_name, _, name = path.partition(':')
+    obj = importlib.import_module(module_name.strip())
+    for attr in name.split('[')[0].strip().split('.'):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _load_entry_points() -> None:
+    """Register serializer types of ENTRY_POINT_GROUP once;
+    registered types are not replaced."""
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    from importlib.metadata import entry_points
+
+    if sys.version_info >= (3, 10):
+        group = entry_points(group=ENTRY_POINT_GROUP)
+    else:
+        group = entry_points().get(ENTRY_POINT_GROUP, ())
+    for entry_point in group:
+        _SERIALIZERS.setdefault(entry_point.name.lower(), entry_point.value)
+
+
+def __getattr__(name: str):
+    path = _EXPORTS.get(name)
+    if path is None:
+        raise AttributeError(f"module '{__name__}' has no attribute "
+                             f"'{name}'")
+    return _import(path)
@@ -4,6 +4,7 @@ import shutil
 import sys
 
 import myserializer
+from myserializer.compression import COMPRESSIONS
 from myserializer.serializer import Serializer
 
 
@@ -11,9 +12,11 @@ def _print_err(error):
     print(f'Error: {error}', file=sys.stderr)
 
 
-def _try_get_serializer(serializer_format: str) -> 'Serializer | None':
+def _try_get_serializer(serializer_format: str,
+                        compression: 'str | None') -> 'Serializer | None':
     try:
-        return myserializer.create_serializer(serializer_format)
+        return myserializer.create_serializer(serializer_format,
+                                              compression)
     except NotImplementedError:
         _print_err(f'Unknown format "{serializer_format}"')
     return None
@@ -31,6 +34,12 @@ def main(argv=None):
                         required=True)
     parser.add_argument('-of', '--output_format', help='output format',
                         required=True)
+    parser.add_argument('-ic', '--input_compression',
+                        choices=COMPRESSIONS,
+                        help='compression of input file, if any')
+    parser.add_argument('-oc', '--output_compression',
+                        choices=COMPRESSIONS,
+                        help='compression of output file, if any')
 
     args = parser.parse_args(argv)
 
@@ -38,8 +47,11 @@ def main(argv=None):
     output_filename = args.output_file
     input_format = args.input_format
     output_format = args.output_format
+    input_compression = args.input_compression
+    output_compression = args.output_compression
 
-    if input_format == output_format:
+    if (input_format == output_format
+            and input_compression == output_compression):
         try:
             shutil.copy(input_filename, output_filename)
             print('Success!')
@@ -48,14 +60,18 @@ def main(argv=None):
         finally:
             return
 
-    if ((input_serializer := _try_get_serializer(input_format)) is None or
-            (output_serializer := _try_get_serializer(output_format)) is None):
+    if ((input_serializer := _try_get_serializer(
+            input_format, input_compression)) is None or
+            (output_serializer := _try_get_serializer(
+                output_format, output_compression)) is None):
         return
 
     try:
-        with open(input_filename, 'r') as input_file:
+        with open(input_filename,
+                  'rb' if input_serializer.binary else 'r') as input_file:
             loaded = input_serializer.load(input_file)
-        with open(output_filename, 'w') as output_file:
+        with open(output_filename,
+                  'wb' if output_serializer.binary else 'w') as output_file:
             output_serializer.dump(loaded, output_file)
         print('Success!')
     except Exception as e:
@@ -0,0 +1,158 @@
+"""Compression module.
+
+This module can compress the output of any serializer
+and decompress its input, using gzip, bz2 or lzma.
+
+If imported as module, the class CompressedSerializer is available.
+"""
+import io
+from typing import Any, BinaryIO, Callable, Dict
+
+from myserializer.serializer import Serializer
+
+
+def _open_gzip(fp: BinaryIO, mode: str,
+               level: 'int | None') -> io.BufferedIOBase:
+    # Compression modules are imported on first use.
+    import gzip
+
+    if mode == 'rb':
+        return gzip.GzipFile(fileobj=fp, mode='rb')
+    # mtime is fixed, so the same objects are dumped to the same bytes.
+    return gzip.GzipFile(fileobj=fp, mode='wb', mtime=0,
+                         compresslevel=9 if level is None else level)
+
+
+def _open_bz2(fp: BinaryIO, mode: str,
+              level: 'int | None') -> io.BufferedIOBase:
+    import bz2
+
+    if mode == 'rb':
+        return bz2.BZ2File(fp, 'rb')
+    return bz2.BZ2File(fp, 'wb', compresslevel=9 if level is None else level)
+
+
+def _open_lzma(fp: BinaryIO, mode: str,
+               level: 'int | None') -> io.BufferedIOBase:
+    import lzma
+
+    if mode == 'rb':
+        return lzma.LZMAFile(fp, 'rb')
+    return lzma.LZMAFile(fp, 'wb', preset=level)
+
+
+COMPRESSIONS: Dict[str, Callable[[BinaryIO, str, 'int | None'],
+                                 io.BufferedIOBase]] = {
+    'gzip': _open_gzip,
+    'bz2': _open_bz2,
+    'lzma': _open_lzma,
+}
+"""Functions opening (de)compressing file objects over BinaryIO
+by compression name."""
+
+
+class CompressedSerializer(Serializer):
+    """The class provides methods for compressed object serialization.
+
+    This class subclasses Serializer class.
+    It wraps another serializer: its output is compressed while being
+    dumped and its input is decompressed while being loaded, by chunks,
+    so neither the whole serialized text nor the whole compressed data
+    has to be kept in memory (unless the wrapped serializer reads
+    or writes it at once). Text is encoded in UTF-8.
+
+    dump and load work with BinaryIO, dumps and loads with bytes.
+    globals and packer are those of the wrapped serializer.
+    """
+
+    binary = True
+
+    def __init__(self, serializer: Serializer, compression: str = 'gzip',
+                 level: 'int | None' = None) -> None:
+        """__init__ method.
+
+        Args:
+            serializer (Serializer): the wrapped serializer.
+            compression (str, optional): 'gzip', 'bz2' or 'lzma'.
+            level (int, optional): compression level (preset for lzma);
+            if not specified, the default of the compression is used.
+
+        Raises:
+            ValueError: if the compression is unknown.
+        """
+        # The state of Serializer is kept by the wrapped serializer.
+        if compression not in COMPRESSIONS:
+            raise ValueError(f'Unknown compression "{compression}"')
+        self.serializer = serializer
+        self.compression = compression
+        self.level = level
+        self.packer = serializer.packer
+
+    @property
+    def globals(self) -> 'Dict[str, Any] | None':
+        """Get or set globals value of the wrapped serializer."""
+        return self.serializer.globals
+
+    @globals.setter
+    def globals(self, value: 'Dict[str, Any] | None'):
+        self.serializer.globals = value
+
+    def dump(self, obj, fp: BinaryIO) -> None:  # type: ignore[override]
+        """Serialize the object to BinaryIO and compress it.
+
+        Args:
+            obj (object): object to be serialized.
+            fp (BinaryIO): writable IO; it is not closed.
+        """
+        with self._open(fp, 'wb') as stream:
+            if self.serializer.binary:
+                self.serializer.dump(obj, stream)
+                return
+            with io.TextIOWrapper(stream, encoding='utf-8',
+                                  newline='') as text:
+                self.serializer.dump(obj, text)
+
+    def dumps(self, obj) -> bytes:  # type: ignore[override]
+        """Serialize the object to compressed bytes.
+
+        Args:
+            obj (object): object to be serialized.
+
+        Returns:
+            bytes: object serialized to bytes.
+        """
+        with io.BytesIO() as stream:
+            self.dump(obj, stream)
+            return stream.getvalue()
+
+    def load(self, fp: BinaryIO) -> Any:  # type: ignore[override]
+        """Decompress BinaryIO and deserialize an object from it.
+
+        Args:
+            fp (BinaryIO): readable IO; it is not closed.
+
+        Returns:
+            deserialized object.
+        """
+        with self._open(fp, 'rb') as stream:
+            if self.serializer.binary:
+                return self.serializer.load(stream)
+            with io.TextIOWrapper(stream, encoding='utf-8',
+                                  newline='') as text:
+                return self.serializer.load(text)
+
+    def loads(self, s: bytes) -> Any:  # type: ignore[override]
+        """Decompress bytes and deserialize an object from them.
+
+        Args:
+            s (bytes): compressed bytes representing serialized object.
+
+        Returns:
+            deserialized object.
+        """
+        with io.BytesIO(s) as stream:
+            return self.load(stream)
+
+    def _open(self, fp: BinaryIO, mode: str) -> Any:
+        """Open (de)compressing file object over fp."""
+        return COMPRESSIONS[self.compression](fp, mode, self.level)
@@ -0,0 +1,81 @@
+"""MyBinary module.
+
+This module can serialize and deserialize objects to (from)
+bytes or BinaryIO in binary format.
+
+If imported as module, the class BinarySerializer is available.
+"""
+from typing import Any, BinaryIO, Dict
+
+from myserializer.my_binary.decoder import BinaryDecoder
+from myserializer.my_binary.encoder import BinaryEncoder
+from myserializer.serializer import Serializer
+
+
+class BinarySerializer(Serializer):
+    """The class provides methods for object serialization.
+
+    This class subclasses Serializer class.
+    It implements object serialization in binary format,
+    see BinaryEncoder: dump and load work with BinaryIO,
+    dumps and loads with bytes.
+
+    Objects are packed in plain mode with raw bytes (see Packer),
+    so ints, floats and bytes are stored natively rather than as strs.
+    """
+
+    binary = True
+
+    def __init__(self, globals: 'Dict[str, Any] | None' = None) -> None:
+        """__init__ method.
+
+        Args:
+            globals (dict, optional): value for globals property.
+        """
+        super().__init__(globals)
+        self.packer.plain = True
+        self.packer.bytes_encoding = 'raw'
+
+    def dump(self, obj, fp: BinaryIO) -> None:  # type: ignore[override]
+        """Serialize the object to BinaryIO in binary format.
+
+        Args:
+            obj (object): object to be serialized.
+            fp (BinaryIO): writable IO.
+        """
+        packed = self.packer.pack_lazy(obj)
+        for chunk in BinaryEncoder().iterencode(packed):
+            fp.write(chunk)
+
+    def dumps(self, obj) -> bytes:  # type: ignore[override]
+        """Serialize the object to bytes in binary format.
+
+        Args:
+            obj (object): object to be serialized.
+
+        Returns:
+            bytes: object serialized to bytes.
+        """
+        return BinaryEncoder().encode(self.packer.pack_lazy(obj))
+
+    def load(self, fp: BinaryIO) -> Any:  # type: ignore[override]
+        """Deserialize an object from BinaryIO in binary format.
+
+        Args:
+            fp (BinaryIO): readable IO.
+
+        Returns:
+            deserialized object.
+        """
+        return self.loads(fp.read())
+
+    def loads(self, s: bytes) -> Any:  # type: ignore[override]
+        """Deserialize an object from bytes in binary format.
+
+        Args:
+            s (bytes): bytes representing serialized object.
+
+        Returns:
+            deserialized object.
+        """
+        return self.packer.unpack(BinaryDecoder().decode(s))
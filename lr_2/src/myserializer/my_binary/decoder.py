@@ -0,0 +1,171 @@
+"""BinaryDecoder module.
+
+This module can decode objects from binary format, see BinaryEncoder.
+
+If imported as module, the class BinaryDecoder is available.
+"""
+from struct import Struct, error as StructError
+from typing import Any, List, Tuple
+
+from myserializer.my_binary.encoder import (
+    INTERN_MAX_COUNT, INTERN_MAX_LEN, MAGIC, TAG_BIG_INT, TAG_BYTES,
+    TAG_DICT, TAG_FALSE, TAG_FLOAT, TAG_INT8, TAG_INT16, TAG_INT32,
+    TAG_INT64, TAG_LIST, TAG_LONG_BYTES, TAG_LONG_DICT, TAG_LONG_LIST,
+    TAG_LONG_STR, TAG_LONG_STR_REF, TAG_NONE, TAG_STR, TAG_STR_REF,
+    TAG_TRUE)
+
+_INT16 = Struct('<h')
+_INT32 = Struct('<i')
+_INT64 = Struct('<q')
+_FLOAT = Struct('<d')
+_UINT16 = Struct('<H')
+_UINT32 = Struct('<I')
+
+_SIZES = {
+    TAG_STR: 1, TAG_LONG_STR: 4, TAG_BYTES: 1, TAG_LONG_BYTES: 4,
+    TAG_LIST: 1, TAG_LONG_LIST: 4, TAG_DICT: 1, TAG_LONG_DICT: 4,
+    TAG_BIG_INT: 4
+}
+"""Maps tags of sized records to the length of their size."""
+
+_NUMBERS = {
+    TAG_INT16: _INT16, TAG_INT32: _INT32, TAG_INT64: _INT64,
+    TAG_FLOAT: _FLOAT
+}
+"""Maps tags of fixed-size numbers to their structs."""
+
+_CONSTANTS = {TAG_NONE: None, TAG_TRUE: True, TAG_FALSE: False}
+
+_NO_KEY = object()
+"""Placeholder of the key of a dict value that is not decoded yet."""
+
+
+class BinaryDecoder:
+    """The class provides methods for object decoding from binary format.
+
+    Provided functions:
+    - decode - decode object from bytes.
+
+    Suppurted object types:
+    - str, bytes;
+    - dict, list;
+    - int, float, bool, None.
+    """
+
+    def decode(self, data: bytes) -> Any:
+        """Decode python object from bytes (or other bytes-like object
+        supporting indexing and slicing, such as mmap).
+
+        Objects are decoded without recursion.
+
+        Raises:
+            ValueError: if data is not a valid binary text.
+        """
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError('Data is not in binary format '
+                             'or has unsupported version')
+        try:
+            obj, pos = self._decode(data, len(MAGIC))
+        except (IndexError, StructError, UnicodeDecodeError) as e:
+            raise ValueError('Binary data is truncated or invalid') from e
+        except TypeError as e:
+            raise ValueError('Binary data has unhashable dict key') from e
+        if pos != len(data):
+            raise ValueError('Extra data after the object')
+        return obj
+
+    def _decode(self, data: bytes, pos: int) -> Tuple[Any, int]:
+        """Decode one record at pos; return (object, position after it)."""
+        strs: List[str] = []
+        root: list = []
+        container: Any = root
+        # Number of records left in the container, key records included.
+        left = 1
+        key: Any = _NO_KEY
+        # Each frame is (container, left, key) of an outer container.
+        stack: list = []
+        while True:
+            while not left:
+                if not stack:
+                    return root[0], pos
+                container, left, key = stack.pop()
+            tag = data[pos]
+            pos += 1
+            size_len = _SIZES.get(tag)
+            if size_len is not None:
+                if size_len == 1:
+                    size = data[pos]
+                else:
+                    size = _UINT32.unpack_from(data, pos)[0]
+                pos += size_len
+                if tag == TAG_STR or tag == TAG_LONG_STR:
+                    end = pos + size
+                    if end > len(data):
+                        raise IndexError('str out of data')
+                    value: Any = str(data[pos:end], 'utf-8',
+                                     'surrogatepass')
+                    pos = end
+                    if len(value) <= INTERN_MAX_LEN \
+                            and len(strs) < INTERN_MAX_COUNT:
+                        strs.append(value)
+                elif tag == TAG_LIST or tag == TAG_LONG_LIST:
+                    value = []
+                    if size:
+                        stack.append((container, left - 1, _NO_KEY))
+                        self._add(container, key, value)
+                        container, left, key = value, size, _NO_KEY
+                        continue
+                elif tag == TAG_DICT or tag == TAG_LONG_DICT:
+                    value = {}
+                    if size:
+                        stack.append((container, left - 1, _NO_KEY))
+                        self._add(container, key, value)
+                        container, left, key = value, size * 2, _NO_KEY
+                        continue
+                else:
+                    end = pos + size
+                    if end > len(data):
+                        raise IndexError('bytes out of data')
+                    value = bytes(data[pos:end])
+                    pos = end
+                    if tag == TAG_BIG_INT:
+                        value = int.from_bytes(value, 'little', signed=True)
+            elif tag == TAG_STR_REF:
+                value = strs[data[pos]]
+                pos += 1
+            elif tag == TAG_INT8:
+                value = data[pos]
+                if value >= 0x80:
+                    value -= 0x100
+                pos += 1
+            elif tag in _NUMBERS:
+                number = _NUMBERS[tag]
+                value = number.unpack_from(data, pos)[0]
+                pos += number.size
+            elif tag == TAG_LONG_STR_REF:
+                value = strs[_UINT16.unpack_from(data, pos)[0]]
+                pos += 2
+            elif tag in _CONSTANTS:
+                value = _CONSTANTS[tag]
+            else:
+                raise ValueError(f'Unknown record tag {tag} '
+                                 f'at position {pos - 1}')
+            left -= 1
+            if type(container) is dict:
+                if key is _NO_KEY:
+                    key = value
+                else:
+                    container[key] = value
+                    key = _NO_KEY
+            else:
+                container.append(value)
+
+    @staticmethod
+    def _add(container: Any, key: Any, value: Any) -> None:
+        """Add the value to the list or, with the key, to the dict."""
+        if type(container) is dict:
+            if key is _NO_KEY:
+                raise TypeError('unhashable dict key')
+            container[key] = value
+        else:
+            container.append(value)
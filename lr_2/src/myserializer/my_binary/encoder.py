@@ -0,0 +1,187 @@
+"""BinaryEncoder module.
+
+This module can encode packed objects in binary format.
+
+If imported as module, the class BinaryEncoder is available.
+"""
+from itertools import chain
+from struct import Struct
+from typing import Any, Callable, Dict, Iterator, List
+
+from myserializer.packer import ConstantNode, PackSlot
+
+MAGIC = b'MSB\x01'
+"""Bytes starting binary text: format name and version."""
+
+INTERN_MAX_LEN = 32
+"""Length of the longest str added to the table of repeated strs."""
+
+INTERN_MAX_COUNT = 65536
+"""Largest number of strs in the table of repeated strs."""
+
+# Record tags. Each record is a tag byte followed by its payload;
+# sizes and counts are little-endian, 1 byte for the lowercase tags
+# and 4 bytes for the uppercase ones.
+TAG_NONE = ord('N')
+TAG_TRUE = ord('T')
+TAG_FALSE = ord('F')
+TAG_INT8 = ord('b')
+TAG_INT16 = ord('h')
+TAG_INT32 = ord('i')
+TAG_INT64 = ord('q')
+TAG_BIG_INT = ord('I')  # size, then signed little-endian bytes
+TAG_FLOAT = ord('d')
+TAG_STR = ord('s')  # size, then UTF-8 bytes
+TAG_LONG_STR = ord('S')
+TAG_STR_REF = ord('r')  # 1-byte index in the table of repeated strs
+TAG_LONG_STR_REF = ord('R')  # 2-byte index
+TAG_BYTES = ord('y')  # size, then raw bytes
+TAG_LONG_BYTES = ord('Y')
+TAG_LIST = ord('l')  # count, then item records
+TAG_LONG_LIST = ord('L')
+TAG_DICT = ord('m')  # count, then key and value records of each item
+TAG_LONG_DICT = ord('M')
+
+_INT8 = Struct('<Bb')
+_INT16 = Struct('<Bh')
+_INT32 = Struct('<Bi')
+_INT64 = Struct('<Bq')
+_FLOAT = Struct('<Bd')
+_SHORT_HEADER = Struct('<BB')
+_LONG_HEADER = Struct('<BI')
+_LONG_REF = Struct('<BH')
+
+_CHUNK_PARTS = 4096
+"""Largest number of encoded parts joined into one chunk by iterencode."""
+
+_END = object()
+"""Sentinel returned by next() when items of a container are over."""
+
+
+def _header(short_tag: int, long_tag: int, size: int) -> bytes:
+    """Encode tag with the size (count) of the record."""
+    if size < 256:
+        return _SHORT_HEADER.pack(short_tag, size)
+    return _LONG_HEADER.pack(long_tag, size)
+
+
+class BinaryEncoder:
+    """The class provides methods for packed object encoding
+    in binary format.
+
+    Provided functions:
+    - encode - encode object to bytes;
+    - iterencode - encode object to bytes by chunks.
+
+    Suppurted object types:
+    - str, bytes;
+    - dict, list;
+    - int, float, bool, None.
+
+    Binary text is MAGIC followed by one type-tagged record. Scalars
+    are stored natively: ints in 1 to 8 bytes (larger ones with their
+    size), floats in 8 bytes and bytes as they are. Strs, bytes and
+    containers are prefixed with their size. Short strs met again are
+    encoded as indexes in the table of already encoded strs, so dict
+    keys and type tags repeated in the tree take 2 or 3 bytes.
+    """
+
+    def __init__(self) -> None:
+        """__init__ method."""
+        self._strs: Dict[str, int] = {}
+
+    def encode(self, obj: Any) -> bytes:
+        """Encode python object to bytes in binary format."""
+        return b''.join(self.iterencode(obj))
+
+    def iterencode(self, obj: Any) -> Iterator[bytes]:
+        """Encode python object in binary format, yielding bytes by chunks.
+
+        Objects are encoded without recursion. Slots of lazily packed
+        trees are resolved while encoding, see Packer.pack_lazy.
+        """
+        self._strs = {}
+        encoders = self._encoders
+        encode_str = self._encode_str
+        parts: List[bytes] = [MAGIC]
+        append = parts.append
+        # Iterators of values of the containers being encoded;
+        # dicts are iterated by keys and values in turn.
+        stack: List[Iterator] = []
+        value: Any = obj
+        while True:
+            value_type = type(value)
+            if value_type is PackSlot:
+                value = value.resolve()
+                value_type = type(value)
+            if value_type is str:
+                append(encode_str(value))
+            elif value_type is dict or value_type is ConstantNode:
+                append(_header(TAG_DICT, TAG_LONG_DICT, len(value)))
+                stack.append(chain.from_iterable(value.items()))
+            elif value_type is list:
+                append(_header(TAG_LIST, TAG_LONG_LIST, len(value)))
+                stack.append(iter(value))
+            else:
+                encode = encoders.get(value_type)
+                if encode is None:
+                    raise NotImplementedError(f'The object of type '
+                                              f'"{value_type}" cannot be '
+                                              'binary encoded')
+                append(encode(self, value))
+            while stack:
+                value = next(stack[-1], _END)
+                if value is not _END:
+                    break
+                stack.pop()
+            else:
+                yield b''.join(parts)
+                return
+            if len(parts) >= _CHUNK_PARTS:
+                yield b''.join(parts)
+                parts.clear()
+
+    def _encode_none(self, obj: None) -> bytes:
+        return b'N'
+
+    def _encode_bool(self, obj: bool) -> bytes:
+        return b'T' if obj else b'F'
+
+    def _encode_int(self, obj: int) -> bytes:
+        if -0x80 <= obj < 0x80:
+            return _INT8.pack(TAG_INT8, obj)
+        if -0x8000 <= obj < 0x8000:
+            return _INT16.pack(TAG_INT16, obj)
+        if -0x80000000 <= obj < 0x80000000:
+            return _INT32.pack(TAG_INT32, obj)
+        if -0x8000000000000000 <= obj < 0x8000000000000000:
+            return _INT64.pack(TAG_INT64, obj)
+        data = obj.to_bytes(obj.bit_length() // 8 + 1, 'little', signed=True)
+        return _LONG_HEADER.pack(TAG_BIG_INT, len(data)) + data
+
+    def _encode_float(self, obj: float) -> bytes:
+        return _FLOAT.pack(TAG_FLOAT, obj)
+
+    def _encode_str(self, obj: str) -> bytes:
+        strs = self._strs
+        index = strs.get(obj)
+        if index is not None:
+            if index < 256:
+                return _SHORT_HEADER.pack(TAG_STR_REF, index)
+            return _LONG_REF.pack(TAG_LONG_STR_REF, index)
+        if len(obj) <= INTERN_MAX_LEN and len(strs) < INTERN_MAX_COUNT:
+            strs[obj] = len(strs)
+        data = obj.encode('utf-8', 'surrogatepass')
+        return _header(TAG_STR, TAG_LONG_STR, len(data)) + data
+
+    def _encode_bytes(self, obj: bytes) -> bytes:
+        return _header(TAG_BYTES, TAG_LONG_BYTES, len(obj)) + obj
+
+    _encoders: Dict[type, Callable[['BinaryEncoder', Any], bytes]] = {
+        type(None): _encode_none,
+        bool: _encode_bool,
+        int: _encode_int,
+        float: _encode_float,
+        str: _encode_str,
+        bytes: _encode_bytes,
+    }
@@ -6,12 +6,44 @@ string or TextIO in JSON format.
 If imported as module, the class JsonSerializer is available.
 """
 import io
-from typing import Any, TextIO, cast
+import mmap
+import os
+from itertools import chain
+from typing import (Any, Dict, Iterable, Iterator, List, Sequence, TextIO,
+                    cast)
 
-from myserializer.my_json.decoder import JsonDecoder
+from myserializer.my_json.decoder import (IncrementalJsonDecoder,
+                                          JsonDecoder, JsonScanner,
+                                          _read_chunks, build_items)
 from myserializer.my_json.encoder import JsonEncoder
 from myserializer.serializer import Serializer
 
+_PACKED_LIST_EVENTS = (('start_map', None), ('map_key', 'type'),
+                       ('string', 'list'), ('map_key', 'value'),
+                       ('start_array', None))
+"""Leading parser events of a packed list, up to its items."""
+
+_PLAIN_LIST_EVENTS = (('start_array', None),)
+"""Leading parser events of a list packed in plain mode."""
+
+
+class _FullLoadNeeded(Exception):
+    """The object at the path references objects packed elsewhere."""
+
+
+def _has_refs(node: Any) -> bool:
+    """Check whether the packed node contains references."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if type(node) is dict:
+            if node.get('type') == 'ref':
+                return True
+            stack.extend(node.values())
+        elif type(node) is list:
+            stack.extend(node)
+    return False
+
 
 class JsonSerializer(Serializer):
     """The class provides methods for object serialization.
@@ -20,6 +52,20 @@ class JsonSerializer(Serializer):
     It implements object serialization in JSON format.
     """
 
+    def __init__(self, globals: Dict[str, Any] = None,
+                 plain: bool = False) -> None:
+        """__init__ method.
+
+        Args:
+            globals (dict, optional): value for globals property.
+            plain (bool, optional): whether objects are packed in plain
+            mode, see Packer. In plain mode JSON-compatible data is
+            serialized as ordinary JSON, and type tags are only used
+            for other objects.
+        """
+        super().__init__(globals)
+        self.packer.plain = plain
+
     def dump(self, obj, fp: TextIO) -> None:
         """Serialize the object to TextIO in JSON format.
 
@@ -27,9 +73,28 @@ class JsonSerializer(Serializer):
             obj (object): object to be serialized.
             fp (TextIO): writable IO.
         """
-        packed = self.packer.pack(obj)
+        # Nodes are packed while being encoded, so the packed tree
+        # is not kept in memory as a whole.
+        packed = self.packer.pack_lazy(obj)
         encoder = JsonEncoder()
-        fp.write(encoder.encode(packed))
+        for chunk in encoder.iterencode(packed):
+            fp.write(chunk)
+
+    def dump_iter(self, objs: Iterable, fp: TextIO) -> None:
+        """Serialize objects to TextIO in JSON Lines format.
+
+        Each object is packed on its own and written as one line,
+        so objects are serialized as they are iterated and the text
+        may be appended to another one. Objects do not share packed
+        objects between lines.
+
+        Args:
+            objs (iterable): objects to be serialized.
+            fp (TextIO): writable IO.
+        """
+        for obj in objs:
+            self.dump(obj, fp)
+            fp.write('\n')
 
     def dumps(self, obj) -> str:
         """Serialize the object to str in JSON format.
@@ -54,11 +119,246 @@ class JsonSerializer(Serializer):
             deserialized object.
         """
         decoder = JsonDecoder()
-        decoded = decoder.decode(fp)
-        if type(decoded) is not dict:
+        return self._unpack_decoded(decoder.decode(fp))
+
+    def load_path(self, path: 'str | os.PathLike') -> Any:
+        """Deserialize an object from the UTF-8 JSON file at the path.
+
+        The file is memory-mapped and decoded from the mapped buffer
+        by chunks, so its text is never read into a str as a whole
+        and the OS page cache serves the reads.
+
+        Args:
+            path (str | PathLike): path to the file.
+
+        Returns:
+            deserialized object.
+        """
+        decoder = JsonDecoder()
+        with open(path, 'rb') as file:
+            if not os.fstat(file.fileno()).st_size:
+                # Empty files cannot be mapped.
+                return self._unpack_decoded(decoder.decode(b''))
+            with mmap.mmap(file.fileno(), 0,
+                           access=mmap.ACCESS_READ) as mapped:
+                decoded = decoder.decode(cast(bytes, mapped))
+        return self._unpack_decoded(decoded)
+
+    def _unpack_decoded(self, decoded: Any) -> Any:
+        """Unpack the decoded packed object."""
+        if type(decoded) is not dict and not self.packer.plain:
+            raise ValueError('Decoded value cannot be unpacked')
+        return self.packer.unpack(cast(dict, decoded))
+
+    def load_iter(self, fp: TextIO) -> Iterator[Any]:
+        """Deserialize objects from TextIO in JSON Lines format.
+
+        fp is read by chunks, and each object is yielded as soon as
+        its line is decoded, see dump_iter. Documents separated by other
+        whitespaces are read as well.
+
+        Args:
+            fp (TextIO): readable IO.
+
+        Raises:
+            ValueError: if the text is invalid or ends inside of
+            a document.
+
+        Yields:
+            deserialized objects.
+        """
+        decoder = IncrementalJsonDecoder()
+        for chunk in _read_chunks(fp):
+            decoded = decoder.feed(chunk) if chunk else decoder.close()
+            for obj in decoded:
+                yield self._unpack_decoded(obj)
+
+    def load_items(self, fp: TextIO, shared: bool = True
+                   ) -> Iterator[Any]:
+        """Deserialize items of a list from TextIO in JSON format.
+
+        Items are decoded and unpacked one by one while fp is read,
+        so the packed list is never built. A list packed as a typed
+        array is unpacked as a whole.
+
+        Args:
+            fp (TextIO): readable IO with a serialized list.
+            shared (bool, optional): whether items may share objects,
+            see Packer.unpack_items. If not, memory is bounded
+            by the largest item rather than by the whole list.
+
+        Raises:
+            ValueError: if the serialized object is not a list.
+
+        Yields:
+            deserialized items.
+        """
+        events = JsonDecoder().iterparse(fp)
+        expected_events = _PLAIN_LIST_EVENTS if self.packer.plain \
+            else _PACKED_LIST_EVENTS
+        parsed = []
+        for expected in expected_events:
+            event = next(events, None)
+            if event != expected:
+                break
+            parsed.append(event)
+        else:
+            yield from self.packer.unpack_items(build_items(events), shared)
+            return
+        if event is not None and len(parsed) == 3:
+            # A list node with keys other than 'value' first.
+            node = next(build_items(chain(parsed, [event], events)))
+            yield from self.packer.unpack(node)
+            return
+        raise ValueError('Decoded value is not a packed list')
+
+    def load_at(self, fp: TextIO, path: Sequence) -> Any:
+        """Deserialize the object at the key path from TextIO in JSON format.
+
+        The result is load(fp)[path[0]][path[1]]..., but only the nodes
+        on the path are decoded: other dict items and list (tuple) items
+        are skipped by scanning, and only the object at the path
+        is unpacked.
+
+        If the object at the path references objects packed elsewhere
+        (shared objects), it cannot be unpacked alone. Then fp is read
+        again from its initial position and loaded whole, so it must
+        be seekable.
+
+        Args:
+            fp (TextIO): readable IO.
+            path (sequence): keys of dicts and indexes of lists and tuples
+            leading to the object, e.g. ('users', 0, 'name').
+
+        Raises:
+            KeyError, IndexError: if there is no object at the path.
+            ValueError: if fp is to be loaded whole but not seekable.
+
+        Returns:
+            deserialized object.
+        """
+        start = fp.tell() if fp.seekable() else None
+        try:
+            return self._load_at(JsonScanner(fp), list(path))
+        except _FullLoadNeeded:
+            if start is None:
+                raise ValueError('The object at the path references '
+                                 'other objects, but IO cannot be read '
+                                 'again to load them') from None
+        fp.seek(start)
+        obj = self.load(fp)
+        for key in path:
+            obj = obj[key]
+        return obj
+
+    def loads_at(self, s: str, path: Sequence) -> Any:
+        """Deserialize the object at the key path from str in JSON format.
+
+        Args:
+            s (str): string representing serialized object.
+            path (sequence): keys and indexes, see load_at.
+
+        Returns:
+            deserialized object.
+        """
+        with io.StringIO(s) as stream:
+            return self.load_at(stream, path)
+
+    def _load_at(self, scanner: JsonScanner, path: List) -> Any:
+        """Find the node at the path with the scanner and unpack it.
+
+        Containers that cannot be scanned (e.g. sets, typed arrays)
+        are unpacked whole and indexed by the rest of the path.
+
+        Raises:
+            _FullLoadNeeded: if a reference is met.
+        """
+        plain = self.packer.plain
+        for depth, key in enumerate(path):
+            index = key if type(key) is int and key >= 0 else None
+            ch = scanner.peek()
+            if ch == '[' and plain and index is not None:
+                scanner.enter()
+                self._scan_items(scanner, index)
+                continue
+            if ch != '{':
+                break
+            scanner.enter()
+            node_key = scanner.next_key()
+            if node_key != 'type':
+                if not plain:
+                    raise ValueError('Decoded value cannot be unpacked')
+                # Plain dict: keys are JSON keys.
+                while node_key is not None and node_key != key:
+                    scanner.skip()
+                    node_key = scanner.next_key()
+                if node_key is None:
+                    raise KeyError(key)
+                continue
+            node = {'type': scanner.decode_next()}
+            if node['type'] == 'dict' or (node['type'] in ('list', 'tuple')
+                                          and index is not None):
+                node_key = scanner.next_key()
+                if node_key == 'value':
+                    scanner.enter()
+                    if node['type'] == 'dict':
+                        self._scan_pairs(scanner, key)
+                    else:
+                        self._scan_items(scanner, cast(int, index))
+                    continue
+                if node_key is not None:
+                    node[node_key] = scanner.decode_next()
+            while (node_key := scanner.next_key()) is not None:
+                node.setdefault(node_key, scanner.decode_next())
+            return self._unpack_at(node, path[depth:])
+        else:
+            return self._unpack_at(scanner.decode_next(), [])
+        return self._unpack_at(scanner.decode_next(), path[depth:])
+
+    def _scan_items(self, scanner: JsonScanner, index: int) -> None:
+        """Move to the item of the entered array at the index."""
+        for _ in range(index):
+            if not scanner.next_item():
+                raise IndexError('index out of range')
+            scanner.skip()
+        if not scanner.next_item():
+            raise IndexError('index out of range')
+
+    def _scan_pairs(self, scanner: JsonScanner, key: Any) -> None:
+        """Move to the value of the key in the entered array of packed
+        dict items."""
+        while scanner.next_item():
+            scanner.enter()
+            if scanner.next_key() != 'type':
+                raise ValueError('Dict items must be packed pairs')
+            scanner.skip()
+            if scanner.next_key() != 'value' or scanner.enter() != '[' \
+                    or not scanner.next_item():
+                raise ValueError('Dict items must be packed pairs')
+            key_node = scanner.decode_next()
+            if not scanner.next_item():
+                raise ValueError('Dict items must be packed pairs')
+            if self._unpack_at(key_node, []) == key:
+                return
+            scanner.skip()
+            if scanner.next_item() or scanner.next_key() is not None:
+                raise ValueError('Dict items must be packed pairs')
+        raise KeyError(key)
+
+    def _unpack_at(self, node: Any, path: List) -> Any:
+        """Unpack the node and get the object at the path in it.
+
+        Raises:
+            _FullLoadNeeded: if the node contains references.
+        """
+        if type(node) is not dict and not self.packer.plain:
             raise ValueError('Decoded value cannot be unpacked')
-        decoded = cast(dict, decoded)
-        return self.packer.unpack(decoded)
+        if _has_refs(node):
+            raise _FullLoadNeeded
+        obj = self.packer.unpack(node)
+        for key in path:
+            obj = obj[key]
+        return obj
 
     def loads(self, s: str) -> Any:
         """Deserialize an object from str in JSON format.
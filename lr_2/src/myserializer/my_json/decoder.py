@@ -2,10 +2,14 @@
 
 This module can decode objects from JSON strings.
 
-If imported as module, the class JsonDecoder is available.
+If imported as module, the classes JsonDecoder, IncrementalJsonDecoder
+and JsonScanner and the function build_items are available.
 """
-from io import StringIO
-from typing import Dict, List, TextIO, Tuple, cast
+import codecs
+import mmap
+import re
+from typing import (Any, Dict, Generator, Iterator, List, TextIO, Tuple,
+                    cast)
 
 WHITESPACE_CHARS = ' \n\r'
 
@@ -19,34 +23,200 @@ STR_ESCAPED = {
     't': '\t',
     '/': '/'
 }
+"""Maps chars following backslashes in escapes, other than \\uXXXX,
+to the escaped chars."""
 
-for i in range(0x20):
-    STR_ESCAPED.setdefault(f'\\u{i:04x}', chr(i))
+NUMBER_CHARS = '0123456789+-.eE'
 
+NUMBER_RE = re.compile(r'-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?')
 
-def _str_json_unescape(s: str) -> str:
-    for k, v in STR_ESCAPED.items():
-        s = s.replace(k, v)
-    return s
+LITERALS = {
+    'true': True,
+    'false': False,
+    'null': None
+}
+
+_WHITESPACE_RE = re.compile(f'[{WHITESPACE_CHARS}]*')
+
+_STR_SPECIAL_RE = re.compile(r'["\\]')
+"""Pattern matching chars that end plain runs of str chars."""
+
+_UNICODE_ESCAPE_RE = re.compile(
+    r'\\u([0-9a-fA-F]{4})(?:\\u([dD][c-fC-F][0-9a-fA-F]{2}))?')
+"""Pattern matching a \\uXXXX escape, which may be followed
+by the escape of a low surrogate."""
+
+_NUMBER_CHARS_RE = re.compile(f'[{re.escape(NUMBER_CHARS)}]*')
+
+_LITERAL_EVENTS = {
+    literal[0]: (literal, 'null' if value is None else 'boolean', value)
+    for literal, value in LITERALS.items()
+}
+"""Maps first chars of literals to (literal, event, value)."""
+
+_SKIP_PATTERN = r'(?:[^"{}\[\]]|"[^"\\]*(?:\\.[^"\\]*)*")*'
+for _ in range(10):
+    _SKIP_PATTERN = (r'(?:[^"{}\[\]]|"[^"\\]*(?:\\.[^"\\]*)*"|[{\[]'
+                     + _SKIP_PATTERN + r'[}\]])*')
+
+_SKIP_RE = re.compile(_SKIP_PATTERN)
+"""Pattern matching text up to the next bracket that does not belong
+to a complete container nested up to 10 levels; strs are complete too.
+Chars are matched one by one, which keeps backtracking linear."""
+
+_CHUNK_SIZE = 65536
+"""Number of chars read from TextIO (bytes decoded from buffers) at once."""
+
+# Parser states: what is expected next.
+_VALUE = 0
+_FIRST_VALUE = 1
+_KEY = 2
+_FIRST_KEY = 3
+_KEY_SEPARATOR = 4
+_ITEM_SEPARATOR = 5
+
+
+def _read_chunks(stream: TextIO) -> Iterator[str]:
+    """Read TextIO by chunks; the last chunk is the empty str."""
+    while True:
+        chunk = stream.read(_CHUNK_SIZE)
+        yield chunk
+        if not chunk:
+            return
+
+
+def _decode_chunks(data: 'bytes | bytearray | memoryview | mmap.mmap'
+                   ) -> Iterator[str]:
+    """Decode UTF-8 bytes by chunks; the last chunk is the empty str.
+
+    Only a chunk of the buffer is copied at a time, so a memory-mapped
+    file is paged in by the OS as it is decoded.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for start in range(0, len(data), _CHUNK_SIZE):
+        chunk = decoder.decode(data[start:start + _CHUNK_SIZE])
+        if chunk:
+            yield chunk
+    chunk = decoder.decode(b'', True)
+    if chunk:
+        yield chunk
+    yield ''
 
 
-def _read_chars(stream: TextIO, amount: int) -> str:
-    chars = stream.read(amount)
-    if len(chars) != amount:
-        raise ValueError('Unexpected end of stream')
-    return chars
+def _text_chunks(s: 'str | TextIO | bytes') -> Iterator[str]:
+    """Get chunks of JSON text from str, TextIO or UTF-8 bytes-like
+    object; the last chunk is the empty str."""
+    if type(s) is str:
+        return iter((cast(str, s), ''))
+    if isinstance(s, (bytes, bytearray, memoryview, mmap.mmap)):
+        return _decode_chunks(s)
+    return _read_chunks(cast(TextIO, s))
+
+
+class _ObjectBuilder:
+    """Builds objects from parser events.
+
+    Attributes:
+        objects (list): built top-level objects.
+    """
+
+    __slots__ = ('objects', '_container', '_key', '_stack')
+
+    def __init__(self) -> None:
+        self.objects: list = []
+        # The container being built and the key of its next value
+        # (None for lists); top-level objects go to objects.
+        self._container: 'Dict | List' = self.objects
+        self._key: 'str | None' = None
+        # Containers and keys of the containers being built.
+        self._stack: List[Tuple['Dict | List', 'str | None']] = []
+
+    def feed(self, events: List[Tuple[str, Any]]) -> None:
+        """Process events, adding objects completed by them to objects."""
+        container: Any = self._container
+        key = self._key
+        stack = self._stack
+        for event, value in events:
+            if event == 'map_key':
+                key = value
+                continue
+            elif event == 'start_map':
+                stack.append((container, key))
+                container = {}
+                continue
+            elif event == 'start_array':
+                stack.append((container, key))
+                container = []
+                key = None
+                continue
+            elif event == 'end_map' or event == 'end_array':
+                value = container
+                container, key = stack.pop()
+            if key is None:
+                container.append(value)
+            else:
+                container.setdefault(key, value)
+        self._container = container
+        self._key = key
+
+
+def build_items(events: Iterator[Tuple[str, Any]]) -> Iterator[Any]:
+    """Build items of an array from parser events one by one.
+
+    Args:
+        events (iterator): events following the 'start_array' event
+        of the array. They are taken up to its 'end_array' event,
+        so the following events can be processed further.
+
+    Example:
+        >>> events = JsonDecoder().iterparse('[{"a": 1}, [], 2]')
+        >>> next(events)
+        ('start_array', None)
+        >>> list(build_items(events))
+        [{'a': 1}, [], 2]
+    """
+    builder = _ObjectBuilder()
+    objects = builder.objects
+    item_events: List[Tuple[str, Any]] = []
+    depth = 0
+    for event in events:
+        kind = event[0]
+        if kind == 'start_map' or kind == 'start_array':
+            depth += 1
+        elif kind == 'end_map' or kind == 'end_array':
+            if not depth:
+                return
+            depth -= 1
+        item_events.append(event)
+        if not depth:
+            builder.feed(item_events)
+            item_events.clear()
+            yield objects.pop()
 
 
 class JsonDecoder:
     """The class provides methods for object decoding from JSON format.
 
     Provided functions:
-    - decode - decode object from JSON string.
+    - decode - decode object from JSON string, TextIO or UTF-8 bytes;
+    - iterparse - parse JSON string, TextIO or UTF-8 bytes into events.
 
     Suppurted object types:
     - str;
     - dict;
-    - list.
+    - list;
+    - int, float, bool, None.
+
+    Text is parsed by chunks into events, which objects are built from.
+    Events are (event, value) tuples:
+    - ('start_map', None), ('map_key', str), ('end_map', None);
+    - ('start_array', None), ('end_array', None);
+    - ('string', str), ('number', int | float), ('boolean', bool),
+    ('null', None).
+
+    Note:
+        Numbers end on the first char that cannot be a part of a number,
+        so numbers cannot be decoded if that char is used as a separator.
     """
 
     item_separator = ','
@@ -77,84 +247,558 @@ class JsonDecoder:
             self.item_separator = item_separator
             self.key_separator = key_separator
 
-    def decode(self, s: 'str | TextIO') -> 'str | Dict | List':
-        """Decode python object from JSON string or TextIO."""
-        if type(s) is str:
-            with StringIO(cast(str, s)) as _stream:
-                return self.decode(_stream)
-        stream = cast(TextIO, s)
+    def decode(self, s: 'str | TextIO | bytes'
+               ) -> 'str | Dict | List | int | float | None':
+        """Decode python object from JSON string, TextIO or UTF-8 bytes.
+
+        TextIO is read by chunks, so chars after the object may be read
+        from it too. Bytes may be any bytes-like object, e.g. mmap:
+        it is decoded by chunks and never copied whole.
+        """
+        builder = _ObjectBuilder()
+        for events in self._iterparse_chunks(s):
+            builder.feed(events)
+        return builder.objects[0]
+
+    def iterparse(self, s: 'str | TextIO | bytes'
+                  ) -> Iterator[Tuple[str, Any]]:
+        """Parse JSON string, TextIO or UTF-8 bytes into events,
+        see JsonDecoder.
+
+        Events are generated while TextIO is read by chunks, so memory
+        does not depend on the size of text. Use build_items to build
+        items of an array from the events.
+
+        Example:
+            >>> list(JsonDecoder().iterparse('{"a": [1]}'))
+            ... # doctest: +NORMALIZE_WHITESPACE
+            [('start_map', None), ('map_key', 'a'), ('start_array', None),
+             ('number', 1), ('end_array', None), ('end_map', None)]
+        """
+        for events in self._iterparse_chunks(s):
+            yield from events
+
+    def _iterparse_chunks(self, s: 'str | TextIO | bytes'
+                          ) -> Iterator[List[Tuple[str, Any]]]:
+        """Parse the first object from str, TextIO or bytes, yielding
+        events of each chunk.
+
+        The same list is yielded each time, it is cleared afterwards.
+        """
+        chunks = _text_chunks(s)
+        events: list = []
+        parser = self._parse(events, False)
+        next(parser)
+        for chunk in chunks:
+            try:
+                parser.send(chunk)
+            except StopIteration:
+                yield events
+                return
+            yield events
+            events.clear()
+
+    def _parse(self, events: list, multiple: bool
+               ) -> Generator[None, str, str]:
+        """Parse JSON text sent by chunks, appending events to the list.
+
+        The generator yields when it needs the next chunk, which must be
+        sent to it; the empty str means the end of text.
+
+        Args:
+            events (list): list to append events to.
+            multiple (bool): whether the text may contain many top-level
+            objects (separated by whitespaces or not). If not, parsing
+            stops after the first object.
+
+        Returns:
+            str: the rest of the last chunk following the first object
+            if parsing stops after it, otherwise the empty str.
+        """
+        append = events.append
+        item_separator = self.item_separator
+        key_separator = self.key_separator
+        # Patterns match empty strs too, so matches are never None.
+        match_whitespace: Any = _WHITESPACE_RE.match
+        match_number: Any = _NUMBER_CHARS_RE.match
+        search_str_special = _STR_SPECIAL_RE.search
+        match_unicode_escape = _UNICODE_ESCAPE_RE.match
+        buf = ''
+        pos = size = 0
+        eof = False
+        # Closing brackets of containers being parsed.
+        stack: List[str] = []
+        state = _VALUE
         while True:
-            ch = _read_chars(stream, 1)
+            if pos >= size:
+                if eof:
+                    if multiple and not stack and state == _VALUE:
+                        return ''
+                    raise ValueError('Unexpected end of stream')
+                buf = yield
+                pos = 0
+                size = len(buf)
+                eof = not size
+                continue
+            ch = buf[pos]
             if ch in WHITESPACE_CHARS:
+                pos = match_whitespace(buf, pos).end()
                 continue
-            return self._decode(stream, ch)
-
-    def _decode(self, stream: TextIO, first_char: str):
-        """Decode object from TextIO assuming previous char was first_char."""
-        if first_char == '{':
-            return self._decode_dict(stream)
-        elif first_char == '[':
-            return self._decode_list(stream)
-        elif first_char == '"':
-            return self._decode_str(stream)
-        else:
-            raise ValueError(f'Unexpected character "{first_char}"')
-
-    def _decode_str(self, stream: TextIO) -> str:
-        buf = ['']
-        while (ch := _read_chars(stream, 1)) != '"':
-            if ch == '\\':
-                next_ch = _read_chars(stream, 1)
-                if next_ch == 'u':
-                    unicode_hex = _read_chars(stream, 4)
-                    unicode_val = int(unicode_hex, 16)
-                    buf.append(chr(unicode_val))
+            if state == _ITEM_SEPARATOR:
+                if ch == item_separator:
+                    pos += 1
+                    state = _KEY if stack[-1] == '}' else _VALUE
+                    continue
+                if ch != stack[-1]:
+                    raise ValueError(
+                        f'Unexpected character "{ch}". '
+                        f'Expected item separator: "{item_separator}"')
+            elif state == _KEY_SEPARATOR:
+                if ch != key_separator:
+                    raise ValueError(
+                        f'Unexpected character "{ch}". '
+                        f'Expected key separator: "{key_separator}"')
+                pos += 1
+                state = _VALUE
+                continue
+            elif state == _FIRST_KEY or state == _FIRST_VALUE:
+                if ch != stack[-1]:
+                    state = _KEY if state == _FIRST_KEY else _VALUE
+
+            if ch == '"':
+                pos += 1
+                end = buf.find('"', pos)
+                if end >= 0 and buf.find('\\', pos, end) < 0:
+                    string = buf[pos:end]
+                    pos = end + 1
                 else:
-                    buf.append(_str_json_unescape(next_ch))
+                    parts = []
+                    while True:
+                        match = search_str_special(buf, pos)
+                        if match is None:
+                            parts.append(buf[pos:])
+                            pos = size
+                        else:
+                            end = match.start()
+                            parts.append(buf[pos:end])
+                            pos = end + 1
+                            if match.group() == '"':
+                                break
+                            pos = end
+                            # A pair of \uXXXX escapes takes 12 chars.
+                            escape = buf[pos + 1:pos + 2] \
+                                if pos + 12 <= size or eof else ''
+                            if escape == 'u':
+                                match = match_unicode_escape(buf, pos)
+                                if match is None:
+                                    raise ValueError('Invalid \\uXXXX escape')
+                                code = int(match.group(1), 16)
+                                low = match.group(2)
+                                if low is not None and 0xd800 <= code < 0xdc00:
+                                    code = 0x10000 + (code - 0xd800 << 10) \
+                                        + int(low, 16) - 0xdc00
+                                    pos = match.end()
+                                else:
+                                    pos += 6
+                                parts.append(chr(code))
+                                continue
+                            elif escape:
+                                parts.append(STR_ESCAPED.get(escape, escape))
+                                pos += 2
+                                continue
+                        # The rest of the str is in the next chunks.
+                        if eof:
+                            raise ValueError('Unexpected end of stream')
+                        chunk = yield
+                        buf = buf[pos:] + chunk
+                        pos = 0
+                        size = len(buf)
+                        eof = not chunk
+                    string = ''.join(parts)
+                if state == _KEY:
+                    append(('map_key', string))
+                    if pos < size and buf[pos] == key_separator:
+                        pos += 1
+                        state = _VALUE
+                    else:
+                        state = _KEY_SEPARATOR
+                    continue
+                append(('string', string))
+            elif state == _KEY:
+                raise ValueError(f'Unexpected character "{ch}"')
+            elif ch == '{':
+                pos += 1
+                stack.append('}')
+                append(('start_map', None))
+                state = _FIRST_KEY
+                continue
+            elif ch == '[':
+                pos += 1
+                stack.append(']')
+                append(('start_array', None))
+                state = _FIRST_VALUE
+                continue
+            elif ch == '}' or ch == ']':
+                if state == _VALUE:
+                    raise ValueError(f'Unexpected character "{ch}"')
+                pos += 1
+                stack.pop()
+                append(('end_map' if ch == '}' else 'end_array', None))
+            elif ch in '-0123456789':
+                end = match_number(buf, pos).end()
+                if end == size and not eof:
+                    # The number may go on in the next chunk.
+                    chunk = yield
+                    buf = buf[pos:] + chunk
+                    pos = 0
+                    size = len(buf)
+                    eof = not chunk
+                    continue
+                number = buf[pos:end]
+                match = NUMBER_RE.fullmatch(number)
+                if match is None:
+                    raise ValueError(f'Invalid number "{number}"')
+                pos = end
+                if match.group(1) is None and match.group(2) is None:
+                    append(('number', int(number)))
+                else:
+                    append(('number', float(number)))
             else:
-                buf.append(ch)
-        return ''.join(buf)
+                literal = _LITERAL_EVENTS.get(ch)
+                if literal is None:
+                    raise ValueError(f'Unexpected character "{ch}"')
+                text, event, value = literal
+                if size - pos < len(text) and not eof:
+                    chunk = yield
+                    buf = buf[pos:] + chunk
+                    pos = 0
+                    size = len(buf)
+                    eof = not chunk
+                    continue
+                if not buf.startswith(text, pos):
+                    raise ValueError(f'Unexpected character "{ch}"')
+                pos += len(text)
+                append((event, value))
 
-    def _decode_list(self, stream: TextIO) -> List:
-        result: list = []
-        first_val = True
-        while (ch := _read_chars(stream, 1)) != ']':
-            if ch in WHITESPACE_CHARS:
+            # A value is parsed.
+            if not stack:
+                if not multiple:
+                    return buf[pos:]
+                state = _VALUE
+            elif pos < size and buf[pos] == item_separator:
+                pos += 1
+                state = _KEY if stack[-1] == '}' else _VALUE
+            else:
+                state = _ITEM_SEPARATOR
+
+
+class IncrementalJsonDecoder(JsonDecoder):
+    """The class decodes JSON objects from text received by parts.
+
+    This class subclasses JsonDecoder class.
+
+    Text is passed to feed by chunks of any size, which are parsed
+    at once; the parser state is kept between calls. The text may contain
+    any number of top-level objects (separated by whitespaces or not),
+    each of them is returned as soon as it is complete.
+
+    Provided functions:
+    - feed - decode the next chunk of text;
+    - close - finish decoding.
+
+    Example:
+        >>> decoder = IncrementalJsonDecoder()
+        >>> decoder.feed('{"a": [1, 2]} {"b"')
+        [{'a': [1, 2]}]
+        >>> decoder.feed(': null}')
+        [{'b': None}]
+        >>> decoder.close()
+        []
+    """
+
+    def __init__(self, separators: 'Tuple[str, str] | None' = None):
+        """__init__ method.
+
+        Args:
+            separators (tuple, optional) - a tuple of (item_sep, key_sep),
+            see JsonDecoder.
+        """
+        super().__init__(separators)
+        self._events: list = []
+        self._parser: 'Generator[None, str, str] | None' = \
+            self._parse(self._events, True)
+        next(self._parser)
+        self._builder = _ObjectBuilder()
+        self._utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+
+    def feed(self, chunk: 'str | bytes') -> List[Any]:
+        """Decode the next chunk of text.
+
+        Args:
+            chunk (str | bytes): the next part of text. Bytes are decoded
+            from UTF-8, chars may be split between chunks.
+
+        Raises:
+            ValueError: if the text is invalid or the decoder is closed.
+
+        Returns:
+            list: objects completed by the chunk.
+        """
+        if not isinstance(chunk, str):
+            chunk = self._utf8_decoder.decode(chunk)
+        if not chunk:
+            if self._parser is None:
+                raise ValueError('Decoder is closed')
+            return []
+        return self._send(chunk)
+
+    def close(self) -> List[Any]:
+        """Finish decoding: the text has no more chunks.
+
+        Raises:
+            ValueError: if the text ends inside of an object.
+
+        Returns:
+            list: objects completed by the end of text (such as top-level
+            numbers, which end with it).
+        """
+        objects = self.feed(self._utf8_decoder.decode(b'', True))
+        return objects + self._send('')
+
+    def _send(self, chunk: str) -> List[Any]:
+        """Send the chunk to the parser and return completed objects."""
+        parser = self._parser
+        if parser is None:
+            raise ValueError('Decoder is closed')
+        try:
+            parser.send(chunk)
+        except StopIteration:
+            self._parser = None
+        except BaseException:
+            self._parser = None
+            raise
+        self._builder.feed(self._events)
+        self._events.clear()
+        objects = self._builder.objects
+        completed = objects.copy()
+        objects.clear()
+        return completed
+
+
+class JsonScanner(JsonDecoder):
+    """The class reads JSON text value by value.
+
+    This class subclasses JsonDecoder class.
+
+    Values can be decoded or skipped; skipped containers are not parsed,
+    only their brackets and strs are scanned, so skipping is much faster
+    than decoding. Skipped containers are not validated.
+
+    Provided functions:
+    - peek - get the first char of the next value;
+    - enter - enter the map or array that is the next value;
+    - next_key - move to the next value of the entered map;
+    - next_item - move to the next value of the entered array;
+    - skip - skip the next value;
+    - decode_next - decode the next value.
+
+    Example:
+        >>> scanner = JsonScanner('{"a": [1, 2], "b": {"c": 3}}')
+        >>> scanner.enter()
+        '{'
+        >>> scanner.next_key()
+        'a'
+        >>> scanner.skip()
+        >>> scanner.next_key()
+        'b'
+        >>> scanner.decode_next()
+        {'c': 3}
+        >>> scanner.next_key() is None
+        True
+    """
+
+    def __init__(self, s: 'str | TextIO | bytes',
+                 separators: 'Tuple[str, str] | None' = None):
+        """__init__ method.
+
+        Args:
+            s (str | TextIO | bytes): JSON text; TextIO is read
+            and UTF-8 bytes are decoded by chunks.
+            separators (tuple, optional) - a tuple of (item_sep, key_sep),
+            see JsonDecoder.
+        """
+        super().__init__(separators)
+        self._chunks = _text_chunks(s)
+        self._buf = ''
+        self._pos = 0
+        # Each frame is [closing bracket, whether no value is reached].
+        self._stack: List[list] = []
+
+    def peek(self) -> str:
+        """Get the first char of the next value (or separator, bracket).
+
+        Returns:
+            str: the char, or the empty str at the end of text.
+        """
+        match_whitespace: Any = _WHITESPACE_RE.match
+        while True:
+            self._pos = match_whitespace(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._read():
+                return ''
+
+    def enter(self) -> str:
+        """Enter the map or array that is the next value.
+
+        Returns:
+            str: its opening bracket.
+        """
+        ch = self.peek()
+        if ch != '{' and ch != '[':
+            raise ValueError(f'Unexpected character "{ch}". '
+                             'Expected map or array')
+        self._pos += 1
+        self._stack.append(['}' if ch == '{' else ']', True])
+        return ch
+
+    def next_key(self) -> 'str | None':
+        """Move to the next value of the entered map.
+
+        The previous value must be decoded or skipped.
+
+        Returns:
+            str | None: the key of the value, or None if the map ends
+            (then it is left).
+        """
+        if not self._next('}'):
+            return None
+        if self.peek() != '"':
+            raise ValueError(f'Unexpected character "{self.peek()}". '
+                             'Expected key')
+        key = self.decode_next()
+        if self.peek() != self.key_separator:
+            raise ValueError(
+                f'Unexpected character "{self.peek()}". '
+                f'Expected key separator: "{self.key_separator}"')
+        self._pos += 1
+        return cast(str, key)
+
+    def next_item(self) -> bool:
+        """Move to the next value of the entered array.
+
+        The previous value must be decoded or skipped.
+
+        Returns:
+            bool: False if the array ends (then it is left).
+        """
+        return self._next(']')
+
+    def skip(self) -> None:
+        """Skip the next value."""
+        ch = self.peek()
+        if ch != '{' and ch != '[':
+            self.decode_next()
+            return
+        match_skipped: Any = _SKIP_RE.match
+        self._pos += 1
+        depth = 1
+        while True:
+            pos = match_skipped(self._buf, self._pos).end()
+            self._pos = pos
+            if pos == len(self._buf):
+                if not self._read():
+                    raise ValueError('Unexpected end of stream')
                 continue
-            if not first_val:
-                if ch != self.item_separator:
-                    raise ValueError(
-                        f'Unexpected character "{ch}". '
-                        f'Expected item separator: "{self.item_separator}"')
-                value = self.decode(stream)
+            ch = self._buf[pos]
+            if ch == '"':
+                # The str goes on in the next chunks.
+                self._skip_str()
+                continue
+            self._pos += 1
+            if ch == '{' or ch == '[':
+                depth += 1
             else:
-                value = self._decode(stream, ch)
-                first_val = False
-            result.append(value)
-        return result
-
-    def _decode_dict(self, stream: TextIO) -> Dict:
-        result: dict = {}
-        first_pair = True
-        while (ch := _read_chars(stream, 1)) != '}':
-            if ch in WHITESPACE_CHARS:
+                depth -= 1
+                if not depth:
+                    return
+
+    def decode_next(self) -> 'str | Dict | List | int | float | None':
+        """Decode the next value."""
+        if self.peek() == '"':
+            buf, pos = self._buf, self._pos + 1
+            end = buf.find('"', pos)
+            if end >= 0 and buf.find('\\', pos, end) < 0:
+                self._pos = end + 1
+                return buf[pos:end]
+        events: list = []
+        parser = self._parse(events, False)
+        next(parser)
+        builder = _ObjectBuilder()
+        chunk = self._buf[self._pos:] or next(self._chunks, '')
+        while True:
+            try:
+                parser.send(chunk)
+            except StopIteration as stop:
+                self._buf = stop.value
+                self._pos = 0
+                break
+            builder.feed(events)
+            events.clear()
+            chunk = next(self._chunks, '')
+        builder.feed(events)
+        return builder.objects[0]
+
+    def _next(self, closer: str) -> bool:
+        """Move to the next value of the entered container."""
+        frame = self._stack[-1]
+        if frame[0] != closer:
+            raise ValueError('The entered container is not '
+                             + ('a map' if closer == '}' else 'an array'))
+        ch = self.peek()
+        if ch == closer:
+            self._pos += 1
+            self._stack.pop()
+            return False
+        if frame[1]:
+            frame[1] = False
+        elif ch == self.item_separator:
+            self._pos += 1
+        else:
+            raise ValueError(
+                f'Unexpected character "{ch}". '
+                f'Expected item separator: "{self.item_separator}"')
+        return True
+
+    def _skip_str(self) -> None:
+        """Skip the str starting at the current position."""
+        search_str_special = _STR_SPECIAL_RE.search
+        self._pos += 1
+        while True:
+            match = search_str_special(self._buf, self._pos)
+            if match is None:
+                self._pos = len(self._buf)
+            elif match.group() == '"':
+                self._pos = match.end()
+                return
+            elif match.end() < len(self._buf):
+                # Skip the escaped char.
+                self._pos = match.end() + 1
                 continue
-            if not first_pair:
-                if ch != self.item_separator:
-                    raise ValueError(
-                        f'Unexpected character "{ch}". '
-                        f'Expected item separator: "{self.item_separator}"')
-                key = self.decode(stream)
             else:
-                key = self._decode(stream, ch)
-                first_pair = False
-            next_char = _read_chars(stream, 1)
-            while next_char in WHITESPACE_CHARS:
-                next_char = _read_chars(stream, 1)
-            if next_char != self.key_separator:
-                raise ValueError(
-                    f'Unexpected character "{next_char}". '
-                    f'Expected key separator: "{self.key_separator}"')
-            value = self.decode(stream)
-            result.setdefault(key, value)
-        return result
+                self._pos = match.start()
+            if not self._read():
+                raise ValueError('Unexpected end of stream')
+
+    def _read(self) -> bool:
+        """Append the next chunk to the unprocessed text.
+
+        Returns:
+            bool: False at the end of text.
+        """
+        chunk = next(self._chunks, '')
+        if not chunk:
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
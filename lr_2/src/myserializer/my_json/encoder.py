@@ -4,7 +4,11 @@ This module can encode packed objects in JSON format.
 
 If imported as module, the class JsonEncoder is available.
 """
-from typing import Dict, List, Tuple, cast
+import math
+import re
+from typing import Any, Dict, Iterator, List, Tuple, cast
+
+from myserializer.packer import ConstantNode, PackSlot
 
 STR_ESCAPED_CHARS = {
     '\\': '\\\\',
@@ -20,23 +24,42 @@ STR_ESCAPED_CHARS = {
 for i in range(0x20):
     STR_ESCAPED_CHARS.setdefault(chr(i), f'\\u{i:04x}')
 
+_STR_ESCAPE_TABLE = str.maketrans(STR_ESCAPED_CHARS)
+
+_STR_ESCAPED_RE = re.compile(r'[\x00-\x1f\\"\x7f]')
+"""Pattern matching any key of STR_ESCAPED_CHARS."""
+
+_CHUNK_PARTS = 4096
+"""Largest number of encoded parts joined into one chunk by iterencode."""
+
+_END = object()
+"""Sentinel returned by next() when items of a container are over."""
+
 
 def _str_json_escape(s: str) -> str:
-    for k, v in STR_ESCAPED_CHARS.items():
-        s = s.replace(k, v)
-    return s
+    # Most strings have nothing to escape: searching is faster than
+    # translating, and the string is returned as it is.
+    if _STR_ESCAPED_RE.search(s) is None:
+        return s
+    return s.translate(_STR_ESCAPE_TABLE)
 
 
 class JsonEncoder:
     """The class provides methods for packed object encoding in JSON format.
 
     Provided functions:
-    - encode - encode object to JSON string.
+    - encode - encode object to JSON string;
+    - iterencode - encode object to JSON string by chunks.
 
     Suppurted object types:
     - str;
     - dict;
-    - list.
+    - list;
+    - int, float, bool, None (packed in plain mode).
+
+    Text of packed constant nodes is encoded once and reused.
+    Slots of lazily packed trees are resolved while encoding,
+    see Packer.pack_lazy.
     """
 
     item_separator = ','
@@ -53,16 +76,80 @@ class JsonEncoder:
         """
         if separators is not None:
             self.item_separator, self.key_separator = separators
+        self._constants: Dict[int, str] = {}
 
-    def encode(self, obj: 'str | Dict | List') -> str:
+    def encode(self, obj: 'str | Dict | List | int | float | None') -> str:
         """Encode python object to string in JSON format."""
+        return ''.join(self.iterencode(obj))
+
+    def iterencode(self, obj: 'str | Dict | List | int | float | None'
+                   ) -> Iterator[str]:
+        """Encode python object in JSON format, yielding text by chunks.
+
+        Objects are encoded without recursion. Each chunk is made of
+        _CHUNK_PARTS encoded parts (values and separators) at most,
+        so the text does not have to be kept in memory as a whole.
+        """
+        item_separator = self.item_separator
+        key_separator = self.key_separator
+        encode_value = self._encode_value
+        parts: List[str] = []
+        # Each frame is [items iterator, closing bracket, is_dict, is_first].
+        stack: list = []
+        value: Any = obj
+        while True:
+            value_type = type(value)
+            if value_type is PackSlot:
+                value = value.resolve()
+                value_type = type(value)
+            if value_type is dict:
+                parts.append('{')
+                stack.append([iter(value.items()), '}', True, True])
+            elif value_type is list:
+                parts.append('[')
+                stack.append([iter(value), ']', False, True])
+            else:
+                parts.append(encode_value(value))
+            while stack:
+                frame = stack[-1]
+                item: Any = next(frame[0], _END)
+                if item is _END:
+                    stack.pop()
+                    parts.append(frame[1])
+                    continue
+                if frame[3]:
+                    frame[3] = False
+                else:
+                    parts.append(item_separator)
+                if frame[2]:
+                    key, value = item
+                    parts.append(encode_value(key))
+                    parts.append(key_separator)
+                else:
+                    value = item
+                break
+            else:
+                yield ''.join(parts)
+                return
+            if len(parts) >= _CHUNK_PARTS:
+                yield ''.join(parts)
+                parts.clear()
+
+    def _encode_value(self, obj) -> str:
+        """Encode object that is not a dict or a list."""
         obj_type = type(obj)
         if obj_type == str:
             return self._encode_str(cast(str, obj))
-        elif obj_type == dict:
-            return self._encode_dict(cast(dict, obj))
-        elif obj_type == list:
-            return self._encode_list(cast(list, obj))
+        elif obj is None:
+            return 'null'
+        elif obj_type == bool:
+            return 'true' if obj else 'false'
+        elif obj_type == int:
+            return str(obj)
+        elif obj_type == float:
+            return self._encode_float(cast(float, obj))
+        elif obj_type == ConstantNode:
+            return self._encode_constant(cast(ConstantNode, obj))
         else:
             raise NotImplementedError(f'The object of type "{obj_type}" '
                                       'cannot be JSON encoded')
@@ -70,26 +157,15 @@ class JsonEncoder:
     def _encode_str(self, obj: str):
         return f'"{_str_json_escape(obj)}"'
 
-    def _encode_list(self, obj: List) -> str:
-        buf = '['
-        first_val = True
-        for val in obj:
-            if not first_val:
-                buf += self.item_separator
-            else:
-                first_val = False
-            buf += self.encode(val)
-        return buf + ']'
-
-    def _encode_dict(self, obj: Dict) -> str:
-        buf = '{'
-        first_pair = True
-        for k, v in obj.items():
-            if not first_pair:
-                buf += self.item_separator
-            else:
-                first_pair = False
-            buf += self.encode(k)
-            buf += self.key_separator
-            buf += self.encode(v)
-        return buf + '}'
+    def _encode_constant(self, obj: ConstantNode) -> str:
+        # Constant nodes live as long as the packer module,
+        # so their ids are never reused.
+        text = self._constants.get(id(obj))
+        if text is None:
+            text = self._constants[id(obj)] = self.encode(dict(obj))
+        return text
+
+    def _encode_float(self, obj: float) -> str:
+        if not math.isfinite(obj):
+            raise ValueError(f'The float "{obj}" cannot be JSON encoded')
+        return repr(obj)
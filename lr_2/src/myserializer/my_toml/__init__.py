@@ -7,15 +7,25 @@ If imported as module, the class TomlSerializer is available.
 """
 from typing import Any, TextIO
 
-import toml
+from myserializer.my_toml.encoder import TomlEncoder
 from myserializer.serializer import Serializer
 
+try:
+    # Python 3.11+ parses TOML with the standard library.
+    from tomllib import loads as _toml_loads
+except ImportError:
+    from toml import loads as _toml_loads  # type: ignore[assignment]
+
 
 class TomlSerializer(Serializer):
     """The class provides methods for object serialization.
 
     This class subclasses Serializer class.
     It implements object serialization in TOML format.
+
+    Packed objects are written flat, with inline tables instead of
+    nested table headers, see TomlEncoder. TOML is read by tomllib
+    if available, otherwise by the toml package.
     """
 
     def dump(self, obj, fp: TextIO) -> None:
@@ -25,8 +35,7 @@ class TomlSerializer(Serializer):
             obj (object): object to be serialized.
             fp (TextIO): writable IO.
         """
-        packed = self.packer.pack(obj)
-        toml.dump(packed, fp)
+        fp.write(self.dumps(obj))
 
     def dumps(self, obj) -> str:
         """Serialize the object to str in TOML format.
@@ -38,7 +47,7 @@ class TomlSerializer(Serializer):
             str: object serialized to str.
         """
         packed = self.packer.pack(obj)
-        return toml.dumps(packed)
+        return TomlEncoder().encode(packed)
 
     def load(self, fp: TextIO) -> Any:
         """Deserialize an object from TextIO in TOML format.
@@ -49,7 +58,7 @@ class TomlSerializer(Serializer):
         Returns:
             deserialized object.
         """
-        return self.packer.unpack(toml.load(fp))
+        return self.loads(fp.read())
 
     def loads(self, s: str) -> Any:
         """Deserialize an object from str in TOML format.
@@ -60,4 +69,4 @@ class TomlSerializer(Serializer):
         Returns:
             deserialized object.
         """
-        return self.packer.unpack(toml.loads(s))
+        return self.packer.unpack(_toml_loads(s))
@@ -0,0 +1,118 @@
+"""TomlEncoder module.
+
+This module can encode packed objects in TOML format.
+
+If imported as module, the class TomlEncoder is available.
+"""
+import re
+from typing import Any, Dict, List
+
+from myserializer.my_json.encoder import STR_ESCAPED_CHARS
+from myserializer.packer import ConstantNode
+
+_STR_ESCAPE_TABLE = str.maketrans({**STR_ESCAPED_CHARS, "'": '\\u0027'})
+"""TOML basic strings have the same escapes as JSON strings; "'" is
+escaped too, as the parser of the toml package mistakes it for
+the start of a literal string in inline arrays."""
+
+_STR_ESCAPED_RE = re.compile(r'[\x00-\x1f\\"\'\x7f]')
+"""Pattern matching any key of _STR_ESCAPE_TABLE."""
+
+_BARE_KEY_RE = re.compile(r'[A-Za-z0-9_-]+')
+
+_END = object()
+"""Sentinel returned by next() when items of a container are over."""
+
+
+def _encode_str(s: str) -> str:
+    if _STR_ESCAPED_RE.search(s) is not None:
+        s = s.translate(_STR_ESCAPE_TABLE)
+    return f'"{s}"'
+
+
+def _encode_key(key: str) -> str:
+    if _BARE_KEY_RE.fullmatch(key) is not None:
+        return key
+    return _encode_str(key)
+
+
+class TomlEncoder:
+    """The class provides methods for packed object encoding
+    in TOML format.
+
+    Provided functions:
+    - encode - encode packed object to TOML string.
+
+    Suppurted object types:
+    - str;
+    - dict;
+    - list.
+
+    The packed tree is encoded flat: items of the root table are
+    key/value lines, except arrays of tables, each table of which is
+    an [[array]] table with key/value lines; deeper tables and arrays
+    are inline, so no nested table headers are written.
+    """
+
+    def encode(self, obj: Dict[str, Any]) -> str:
+        """Encode packed object to string in TOML format."""
+        lines = []
+        tables = []
+        for key, value in obj.items():
+            key = _encode_key(key)
+            if type(value) is list and value and all(
+                    type(item) is dict or type(item) is ConstantNode
+                    for item in value):
+                # Tables go after the key/value lines of the root table.
+                for item in value:
+                    tables.append(f'\n[[{key}]]\n')
+                    tables.extend(self._encode_items(item))
+            else:
+                lines.append(f'{key} = {self._encode_value(value)}\n')
+        return ''.join(lines + tables)
+
+    def _encode_items(self, obj: Dict[str, Any]) -> List[str]:
+        """Encode items of table as key/value lines."""
+        return [f'{_encode_key(key)} = {self._encode_value(value)}\n'
+                for key, value in obj.items()]
+
+    def _encode_value(self, obj: Any) -> str:
+        """Encode object as inline TOML value without recursion."""
+        parts: List[str] = []
+        # Each frame is [items iterator, closing bracket, is_dict, is_first].
+        stack: list = []
+        value = obj
+        while True:
+            value_type = type(value)
+            if value_type is str:
+                parts.append(_encode_str(value))
+            elif value_type is dict or value_type is ConstantNode:
+                parts.append('{')
+                stack.append([iter(value.items()), '}', True, True])
+            elif value_type is list:
+                parts.append('[')
+                stack.append([iter(value), ']', False, True])
+            else:
+                raise NotImplementedError(f'The object of type '
+                                          f'"{value_type}" cannot be '
+                                          'TOML encoded')
+            while stack:
+                frame = stack[-1]
+                item: Any = next(frame[0], _END)
+                if item is _END:
+                    stack.pop()
+                    parts.append(frame[1])
+                    continue
+                if frame[3]:
+                    frame[3] = False
+                else:
+                    parts.append(', ')
+                if frame[2]:
+                    key, value = item
+                    parts.append(_encode_key(key))
+                    parts.append(' = ')
+                else:
+                    value = item
+                break
+            else:
+                return ''.join(parts)
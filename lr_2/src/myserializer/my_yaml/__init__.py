@@ -5,19 +5,60 @@ string or TextIO in YAML format.
 
 If imported as module, the class YamlSerializer is available.
 """
-from typing import Any, TextIO
+from typing import Any, Dict, Iterable, Iterator, TextIO
 
 import yaml
+from myserializer.packer import ConstantNode
 from myserializer.serializer import Serializer
 
+try:
+    # LibYAML bindings parse and emit YAML in C.
+    from yaml import CSafeDumper as _BaseDumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _BaseDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+
+class _Dumper(_BaseDumper):
+    """SafeDumper representing constant nodes as ordinary mappings.
+
+    Constant nodes are shared, but they are not dumped as aliases.
+    """
+
+    def ignore_aliases(self, data) -> bool:
+        return type(data) is ConstantNode or super().ignore_aliases(data)
+
+
+_Dumper.add_representer(ConstantNode, _Dumper.represent_dict)
+
 
 class YamlSerializer(Serializer):
     """The class provides methods for object serialization.
 
     This class subclasses Serializer class.
     It implements object serialization in YAML format.
+
+    LibYAML (CSafeLoader and CSafeDumper) is used if PyYAML is built
+    with it, otherwise the pure Python SafeLoader and SafeDumper.
     """
 
+    def __init__(self, globals: 'Dict[str, Any] | None' = None,
+                 flow_style: 'bool | None' = False) -> None:
+        """__init__ method.
+
+        Args:
+            globals (dict, optional): value for globals property.
+            flow_style (bool | None, optional): default_flow_style
+            of the dumper. If False, all nodes are written in block
+            style; if None, nodes without child nodes (such as
+            {type: int, value: '1'}) are written on one line in flow
+            style, which is more compact; if True, all nodes are written
+            in flow style.
+        """
+        super().__init__(globals)
+        self.flow_style = flow_style
+
     def dump(self, obj, fp: TextIO) -> None:
         """Serialize the object to TextIO in YAML format.
 
@@ -26,7 +67,8 @@ class YamlSerializer(Serializer):
             fp (TextIO): writable IO.
         """
         packed = self.packer.pack(obj)
-        yaml.safe_dump(packed, fp)
+        yaml.dump(packed, fp, Dumper=_Dumper,
+                  default_flow_style=self.flow_style)
 
     def dumps(self, obj) -> str:
         """Serialize the object to str in YAML format.
@@ -38,7 +80,23 @@ class YamlSerializer(Serializer):
             str: object serialized to str.
         """
         packed = self.packer.pack(obj)
-        return yaml.safe_dump(packed)
+        return yaml.dump(packed, Dumper=_Dumper,
+                         default_flow_style=self.flow_style)
+
+    def dump_all(self, objs: Iterable, fp: TextIO) -> None:
+        """Serialize objects to TextIO as a YAML stream of documents.
+
+        Each object is packed on its own when the previous document
+        is written, so objects are serialized as they are iterated.
+        Objects do not share packed objects between documents.
+
+        Args:
+            objs (iterable): objects to be serialized.
+            fp (TextIO): writable IO.
+        """
+        packed = (self.packer.pack(obj) for obj in objs)
+        yaml.dump_all(packed, fp, Dumper=_Dumper,
+                      default_flow_style=self.flow_style)
 
     def load(self, fp: TextIO) -> Any:
         """Deserialize an object from TextIO in YAML format.
@@ -49,7 +107,22 @@ class YamlSerializer(Serializer):
         Returns:
             deserialized object.
         """
-        return self.packer.unpack(yaml.safe_load(fp))
+        return self.packer.unpack(yaml.load(fp, Loader=_Loader))
+
+    def load_all(self, fp: TextIO) -> Iterator[Any]:
+        """Deserialize objects from a YAML stream of documents in TextIO.
+
+        Documents are parsed and unpacked one by one while fp is read,
+        see dump_all.
+
+        Args:
+            fp (TextIO): readable IO.
+
+        Yields:
+            deserialized objects.
+        """
+        for packed in yaml.load_all(fp, Loader=_Loader):
+            yield self.packer.unpack(packed)
 
     def loads(self, s: str) -> Any:
         """Deserialize an object from str in YAML format.
@@ -60,4 +133,4 @@ class YamlSerializer(Serializer):
         Returns:
             deserialized object.
         """
-        return self.packer.unpack(yaml.safe_load(s))
+        return self.packer.unpack(yaml.load(s, Loader=_Loader))
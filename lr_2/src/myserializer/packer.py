@@ -8,23 +8,250 @@ containing only three types:
 
 If imported as module, the class Packer is available.
 """
+import binascii
 import builtins
-import inspect
 import marshal
-import re
-from base64 import b64decode, b64encode
-from pydoc import locate
-from types import CellType, FunctionType
-from typing import Any, Callable, Dict, List, cast
+import math
+import sys
+from array import array
+from collections import OrderedDict, namedtuple
+from base64 import b85decode, b85encode
+from types import CellType, CodeType, FunctionType, ModuleType
+from typing import (Any, Callable, Dict, Hashable, Iterable, Iterator, List,
+                    Tuple, cast)
 
 
-def _make_cell(contents):
-    _contents = contents
+_PENDING = object()
+"""Placeholder of an unpacked object that is not created yet."""
 
-    def internal():
-        return _contents
 
-    return internal.__closure__[0]
+class ConstantNode(dict):
+    """Packed node of a frequent scalar, shared by all packed trees.
+
+    Constant nodes cannot be modified: methods changing a dict raise
+    TypeError. Copies made by dict(node) or node.copy() are plain dicts,
+    which may be modified.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('Constant nodes cannot be modified')
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+class PackSlot:
+    """Place of a packed node in a lazily packed tree.
+
+    Slots are made by Packer.pack_lazy for child objects that are not
+    packed yet. A slot must be resolved to get its node: all slots
+    of a tree must be resolved once, in the order they appear
+    in the tree (depth-first, in order of list items and dict values),
+    to get the same tree as Packer.pack makes.
+
+    Attributes:
+        obj: the object to be packed.
+    """
+
+    __slots__ = ('obj', '_pack')
+
+    def __init__(self, obj: Any, pack: Callable[[Any], Any]) -> None:
+        self.obj = obj
+        self._pack = pack
+
+    def resolve(self) -> Any:
+        """Pack the object; its child objects are put into new slots."""
+        return self._pack(self.obj)
+
+
+_NONE_NODE = ConstantNode(type='None')
+_TRUE_NODE = ConstantNode(type='bool', value='True')
+_FALSE_NODE = ConstantNode(type='bool', value='False')
+_EMPTY_STR_NODE = ConstantNode(type='str', value='')
+
+_SMALL_INT_MIN = -5
+_SMALL_INT_MAX = 256
+_SMALL_INT_NODES = [ConstantNode(type='int', value=str(i))
+                    for i in range(_SMALL_INT_MIN, _SMALL_INT_MAX + 1)]
+"""Constant nodes of ints from _SMALL_INT_MIN to _SMALL_INT_MAX."""
+
+_ARRAY_MIN_SIZE = 16
+"""Length from which lists of ints or floats are packed as typed arrays."""
+
+_DECIMAL_INT_MAX = 2 ** 64 - 1
+"""Absolute value of the largest int packed in decimal, not in hex.
+
+Conversion of ints to and from decimal str takes quadratic time,
+and hex conversion takes linear time.
+"""
+
+_PLAIN_INT_MAX = 2 ** 53 - 1
+"""Absolute value of the largest int left untagged in plain mode.
+
+Larger ints are tagged, so plain output can be read by JSON parsers
+that keep all numbers as doubles.
+"""
+
+
+def _b64_to_str(data) -> str:
+    return binascii.b2a_base64(data, newline=False).decode('ascii')
+
+
+def _b85_to_str(data) -> str:
+    return b85encode(data).decode('ascii')
+
+
+_BYTES_ENCODERS: Dict[str, Callable[[Any], 'str | bytes']] = {
+    'base64': _b64_to_str,
+    'base85': _b85_to_str,
+    'raw': bytes,
+}
+"""Functions encoding bytes-like objects to str (bytes for 'raw')
+by encoding name."""
+
+_BYTES_DECODERS: Dict[str, Callable[[Any], bytes]] = {
+    'base64': binascii.a2b_base64,
+    'base85': b85decode,
+    'raw': bytes,
+}
+"""Functions decoding bytes from str (bytes for 'raw') by encoding name."""
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+"""Statistics of a cache, the same as functools.lru_cache provides."""
+
+CodeCacheInfo = namedtuple('CodeCacheInfo', ['pack', 'unpack'])
+"""Statistics of the code caches used on packing and unpacking."""
+
+
+class _LRUCache:
+    """Mapping of bounded size that drops least recently used items.
+
+    Attributes:
+        maxsize (int): maximal number of items, 0 disables the cache.
+        hits (int): number of successful lookups.
+        misses (int): number of failed lookups.
+    """
+
+    __slots__ = ('maxsize', 'hits', 'misses', '_items')
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """Get the value of key, or None if there is no such key."""
+        items = self._items
+        value = items.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            items.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Set the value of key, dropping the oldest item if full."""
+        if self.maxsize <= 0:
+            return
+        items = self._items
+        items[key] = value
+        items.move_to_end(key)
+        if len(items) > self.maxsize:
+            items.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        """Get cache statistics."""
+        return CacheInfo(self.hits, self.misses, self.maxsize,
+                         len(self._items))
+
+    def clear(self) -> None:
+        """Remove all items and reset statistics."""
+        self._items.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def _array_dtype(values: list) -> 'str | None':
+    """Get typecode of array that can hold all values, if there is one."""
+    value_type = type(values[0])
+    if value_type is float:
+        dtype = 'd'
+    elif value_type is int:
+        dtype = 'q'
+    else:
+        return None
+    for value in values:
+        if type(value) is not value_type:
+            return None
+    return dtype
+
+
+def _array_to_str(values: array) -> str:
+    """Encode array items in little-endian byte order to base64 str."""
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return _b64_to_str(values)
+
+
+def _array_from_str(dtype: str, s: str) -> array:
+    """Decode array of given typecode from _array_to_str result."""
+    values = array(dtype)
+    values.frombytes(binascii.a2b_base64(s))
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def _patch_list(frame: '_UnpackFrame', pos: int, value: Any) -> None:
+    frame.obj[pos] = value
+
+
+def _patch_dict(frame: '_UnpackFrame', pos: int, value: Any) -> None:
+    if pos % 2 == 0:
+        raise ValueError('Dict key referencing its container '
+                         'cannot be unpacked')
+    frame.obj[frame.results[pos - 1]] = value
+
+
+def _patch_cell(frame: '_UnpackFrame', pos: int, value: Any) -> None:
+    frame.obj.cell_contents = value
+
+
+class _UnpackFrame:
+    """Unpacking state of one packed node that has child nodes.
+
+    Attributes:
+        nodes (list): child nodes to be unpacked.
+        results (list): unpacked values of already processed child nodes.
+        finish (callable): builds the object from the list of results.
+        obj: the object if it is created before its child nodes are
+        unpacked (mutable containers), otherwise _PENDING. If the object
+        is created, finish only fills it with the results.
+        patch (callable, optional): replaces the result at given position
+        in obj; used to resolve references to objects being unpacked.
+        index (int, optional): index of the object in the memo.
+    """
+
+    __slots__ = ('nodes', 'results', 'finish', 'obj', 'patch', 'index')
+
+    def __init__(self, nodes: List[Dict], finish: Callable[[list], Any],
+                 results: 'list | None' = None, obj: Any = _PENDING,
+                 patch: 'Callable | None' = None) -> None:
+        self.nodes = nodes
+        self.results = [] if results is None else results
+        self.finish = finish
+        self.obj = obj
+        self.patch = patch
+        self.index: 'int | None' = None
 
 
 class Packer:
@@ -39,26 +266,75 @@ class Packer:
     - None
     - int, float, complex
     - bool
-    - str, bytes, bytearray
+    - str, bytes, bytearray, memoryview
     - dict, list, tuple
     - set, frozenset
     - range
+    - array.array
     - user-defined function
 
+    Packing and unpacking do not recurse: nested objects are processed
+    using an explicit stack, so nesting depth is limited only by memory.
+
+    Ints that do not fit into 64 bits are packed in hex, e.g. '-0x1f',
+    so they take linear time to pack and unpack and are not limited
+    by sys.get_int_max_str_digits().
+
+    None, bools, ints from -5 to 256 and the empty str are packed as
+    shared read-only nodes of type ConstantNode, a dict subclass.
+
+    Bytes-like objects are packed as one node with their data encoded
+    to str in base64 or, if bytes_encoding is 'base85', in base85.
+    If bytes_encoding is 'raw', the data is kept as bytes, which only
+    binary formats can hold.
+
+    Lists of at least 16 ints or floats of the same type are packed as
+    one typed array node: its dtype is an array typecode and its value
+    is base64 of the items in little-endian byte order. Ints must fit
+    into 64 bits.
+
+    Containers, cells and functions met more than once are packed once:
+    each next occurrence is packed as a reference to the first one,
+    so shared objects stay shared after unpacking and objects may
+    contain themselves.
+
+    In plain mode None, str, bool, float and int values, lists and dicts
+    with str keys (except the key 'type') are packed as themselves,
+    and type tags are only used for other objects. Plain output is
+    ordinary JSON data if no tags are needed, but it is not limited to
+    str, list and dict.
+
+    Code objects of packed and unpacked functions are cached, so packing
+    or unpacking the same functions many times does not repeat marshal
+    work.
+
     Provided methods:
     - pack - pack python object into dict;
-    - unpack - unpack object from dict.
+    - pack_lazy - pack python object into dict, packing its child nodes
+    on demand;
+    - unpack - unpack object from dict;
+    - unpack_items - unpack items of a packed list one by one;
+    - code_cache_info - get statistics of the code caches;
+    - code_cache_clear - clear the code caches.
 
     Note:
         Objects serialized using Python of some version
         must be deserialized using that specific version of Python.
     """
 
-    def __init__(self, globals: Dict[str, Any] = None) -> None:
+    def __init__(self, globals: Dict[str, Any] = None,
+                 plain: bool = False,
+                 bytes_encoding: str = 'base64',
+                 code_cache_size: int = 128) -> None:
         """__init__ method.
 
         Args:
             globals (dict, optional): value for globals property.
+            plain (bool, optional): value for plain property.
+            bytes_encoding (str, optional): value for bytes_encoding
+            property.
+            code_cache_size (int, optional): maximal number of code objects
+            cached on each of packing and unpacking; 0 disables caching.
 
         Note:
             globals value is used when functions are unpacked:
@@ -71,94 +347,680 @@ class Packer:
             of globals has no effect.
         """
         self.globals = globals
+        self.plain = plain
+        self.bytes_encoding = bytes_encoding
+        # Maps (id, bytes encoding) of code objects to (code, packed value).
+        # Code objects are kept to be sure that their ids are not reused.
+        self._pack_code_cache = _LRUCache(code_cache_size)
+        # Maps (bytes encoding, packed value) to code objects.
+        self._unpack_code_cache = _LRUCache(code_cache_size)
+
+    @property
+    def plain(self) -> bool:
+        """Get or set whether plain mode is used.
+
+        In plain mode JSON-compatible values are packed untagged.
+        Unpacking in plain mode also accepts output of the tagged mode.
+        """
+        return self._plain
+
+    @plain.setter
+    def plain(self, value: bool) -> None:
+        self._plain = value
+        if value:
+            self._pack_leaf_dispatch = self._pack_plain_leaf_dispatch
+            self._pack_dispatch = self._pack_plain_dispatch
+            self._unpack_leaf_dispatch = self._unpack_plain_leaf_dispatch
+            self._unpack_dispatch = self._unpack_plain_dispatch
+        else:
+            for name in ('_pack_leaf_dispatch', '_pack_dispatch',
+                         '_unpack_leaf_dispatch', '_unpack_dispatch'):
+                self.__dict__.pop(name, None)
+
+    @property
+    def bytes_encoding(self) -> str:
+        """Get or set the encoding of packed bytes-like objects.
+
+        Supported encodings are 'base64', 'base85' and 'raw'. Base85
+        output is about 6% shorter, but the standard library encodes it
+        in pure Python, which is about a thousand times slower than
+        base64. 'raw' keeps bytes as they are, so the packed tree
+        is not limited to str, list and dict.
+        Unpacking supports all encodings regardless of this value.
+        """
+        return self._bytes_encoding
+
+    @bytes_encoding.setter
+    def bytes_encoding(self, value: str) -> None:
+        if value not in _BYTES_ENCODERS:
+            raise ValueError(f'Unknown bytes encoding "{value}"')
+        self._bytes_encoding = value
+
+    def code_cache_info(self) -> CodeCacheInfo:
+        """Get statistics of the code caches used on packing and unpacking.
+
+        Returns:
+            CodeCacheInfo: a named tuple (pack, unpack) of CacheInfo.
+        """
+        return CodeCacheInfo(self._pack_code_cache.info(),
+                             self._unpack_code_cache.info())
+
+    def code_cache_clear(self) -> None:
+        """Clear the code caches and their statistics."""
+        self._pack_code_cache.clear()
+        self._unpack_code_cache.clear()
 
     def pack(self, obj) -> 'Dict[str, str | List[Dict] | Dict]':
         """Pack object into one dict."""
-        data: 'Dict[str, str | List[Dict] | Dict]' = {}
-        obj_type = type(obj)
-        obj_type_str = re.findall("'(.+?)'", str(obj_type))[0]
-        if obj is None:
-            data['type'] = 'None'
-        elif obj_type in (str, int, float, complex, bool):
-            data['type'] = obj_type_str
-            data['value'] = str(obj)
-        elif obj_type == dict:
-            data['type'] = 'dict'
-            data['value'] = list(map(self.pack, obj.items()))
-        elif obj_type in (tuple, list, set, frozenset):
-            data['type'] = obj_type_str
-            data['value'] = list(map(self.pack, obj))
-        elif obj_type in (bytes, bytearray):
-            data['type'] = obj_type_str
-            data['value'] = self.pack(b64encode(obj).decode())
-        elif obj_type == range:
-            data['type'] = 'range'
-            obj = cast(range, obj)
-            data['start'] = self.pack(obj.start)
-            data['stop'] = self.pack(obj.stop)
-            data['step'] = self.pack(obj.step)
-        elif obj_type == CellType:
-            data['type'] = 'cell'
-            data['value'] = self.pack(cast(CellType, obj).cell_contents)
-        elif inspect.ismodule(obj):
-            data['type'] = 'module'
-            data['name'] = self.pack(obj.__name__)
-        elif inspect.isfunction(obj):
-            data['type'] = 'function'
-            data['doc'] = self.pack(obj.__doc__)
-            data['name'] = self.pack(obj.__name__)
-            data['code'] = self.pack(marshal.dumps(obj.__code__))
-            data['defaults'] = self.pack(obj.__defaults__)
-            data['closure'] = self.pack(obj.__closure__)
-        else:
-            raise NotImplementedError(f'The object of type "{obj_type}" '
-                                      'cannot be packed')
+        leaves = self._pack_leaf_dispatch
+        dispatch = self._pack_dispatch
+        root = [obj]
+        # Each frame is [container, position, keys]: values of container
+        # are packed in place, keys is None for lists packed by index.
+        frame: list = [root, 0, None]
+        stack = [frame]
+        # Maps ids of packed objects to their indexes. Objects are kept
+        # to be sure that their ids are not reused while packing.
+        memo: Dict[int, Tuple[int, Any]] = {}
+        container, pos, keys, size = root, 0, None, 1
+        while True:
+            if pos == size:
+                stack.pop()
+                if not stack:
+                    return root[0]
+                frame = stack[-1]
+                container, pos, keys = frame
+                size = len(container) if keys is None else len(keys)
+                continue
+            key = pos if keys is None else keys[pos]
+            value = container[key]
+            pos += 1
+            value_type = type(value)
+            handler = leaves.get(value_type)
+            if handler is None and value_type not in dispatch:
+                value_type = self._find_pack_type(value)
+                handler = leaves.get(value_type)
+            if handler is not None:
+                container[key] = handler(self, value)
+                continue
+            entry = memo.get(id(value))
+            if entry is not None:
+                container[key] = {'type': 'ref', 'value': str(entry[0])}
+                continue
+            memo[id(value)] = (len(memo), value)
+            depth = len(stack)
+            container[key] = dispatch[value_type](self, value, stack)
+            if len(stack) != depth:
+                frame[1] = pos
+                frame = stack[-1]
+                container, pos, keys = frame
+                size = len(container) if keys is None else len(keys)
+
+    def pack_lazy(self, obj) -> Any:
+        """Pack object into one dict with child nodes packed on demand.
+
+        Only the root node is packed at once. Child objects which
+        are not packed by the handler of their parent are put into
+        PackSlot objects, see PackSlot. This lets a writer emit
+        the nodes while packing, without keeping the whole tree.
+        """
+        leaves = self._pack_leaf_dispatch
+        dispatch = self._pack_dispatch
+        memo: Dict[int, Tuple[int, Any]] = {}
+
+        def pack(value: Any) -> Any:
+            value_type = type(value)
+            handler = leaves.get(value_type)
+            if handler is None and value_type not in dispatch:
+                value_type = self._find_pack_type(value)
+                handler = leaves.get(value_type)
+            if handler is not None:
+                return handler(self, value)
+            entry = memo.get(id(value))
+            if entry is not None:
+                return {'type': 'ref', 'value': str(entry[0])}
+            memo[id(value)] = (len(memo), value)
+            stack: list = []
+            node = dispatch[value_type](self, value, stack)
+            for container, pos, keys in stack:
+                if keys is None:
+                    for index in range(pos, len(container)):
+                        container[index] = PackSlot(container[index], pack)
+                else:
+                    for key in keys[pos:]:
+                        container[key] = PackSlot(container[key], pack)
+            return node
+
+        return pack(obj)
+
+    def _find_pack_type(self, obj) -> type:
+        """Find supported base type of an object of not exact type."""
+        if isinstance(obj, ModuleType):
+            return ModuleType
+        elif isinstance(obj, FunctionType):
+            return FunctionType
+        raise NotImplementedError(f'The object of type "{type(obj)}" '
+                                  'cannot be packed')
+
+    def _pack_none(self, obj) -> Dict:
+        return _NONE_NODE
+
+    def _pack_str(self, obj: str) -> Dict:
+        if not obj:
+            return _EMPTY_STR_NODE
+        return {'type': 'str', 'value': obj}
+
+    def _pack_int(self, obj: int) -> Dict:
+        if _SMALL_INT_MIN <= obj <= _SMALL_INT_MAX:
+            return _SMALL_INT_NODES[obj - _SMALL_INT_MIN]
+        if -_DECIMAL_INT_MAX <= obj <= _DECIMAL_INT_MAX:
+            return {'type': 'int', 'value': str(obj)}
+        return {'type': 'int', 'value': hex(obj)}
+
+    def _pack_float(self, obj: float) -> Dict:
+        return {'type': 'float', 'value': str(obj)}
+
+    def _pack_complex(self, obj: complex) -> Dict:
+        return {'type': 'complex', 'value': str(obj)}
+
+    def _pack_bool(self, obj: bool) -> Dict:
+        return _TRUE_NODE if obj else _FALSE_NODE
+
+    def _pack_items(self, values: list, stack: list) -> list:
+        """Pack values in place or push them to the stack.
+
+        Leading leaves are packed immediately. If a value that is not a leaf
+        is met, the rest of values is pushed to the stack to be packed later.
+        """
+        leaves = self._pack_leaf_dispatch
+        for pos, value in enumerate(values):
+            handler = leaves.get(type(value))
+            if handler is None:
+                stack.append([values, pos, None])
+                break
+            values[pos] = handler(self, value)
+        return values
+
+    def _pack_dict(self, obj: dict, stack: list) -> Dict:
+        leaves = self._pack_leaf_dispatch
+        items = []
+        pending = []
+        for key, value in obj.items():
+            key_handler = leaves.get(type(key))
+            value_handler = leaves.get(type(value))
+            if key_handler is None or value_handler is None:
+                pair = [key, value]
+                pending.append(pair)
+            else:
+                pair = [key_handler(self, key), value_handler(self, value)]
+            items.append({'type': 'tuple', 'value': pair})
+        stack.extend([pair, 0, None] for pair in reversed(pending))
+        return {'type': 'dict', 'value': items}
+
+    def _pack_list(self, obj: list, stack: list) -> Dict:
+        if len(obj) >= _ARRAY_MIN_SIZE:
+            dtype = _array_dtype(obj)
+            if dtype is not None:
+                try:
+                    values = array(dtype, obj)
+                except OverflowError:
+                    pass
+                else:
+                    return {'type': 'list', 'dtype': dtype,
+                            'value': _array_to_str(values)}
+        return {'type': 'list',
+                'value': self._pack_items(list(obj), stack)}
+
+    def _pack_tuple(self, obj: tuple, stack: list) -> Dict:
+        return {'type': 'tuple',
+                'value': self._pack_items(list(obj), stack)}
+
+    def _pack_set(self, obj: set, stack: list) -> Dict:
+        return {'type': 'set',
+                'value': self._pack_items(list(obj), stack)}
+
+    def _pack_frozenset(self, obj: frozenset, stack: list) -> Dict:
+        return {'type': 'frozenset',
+                'value': self._pack_items(list(obj), stack)}
+
+    def _pack_buffer(self, obj_type: str, obj) -> Dict:
+        """Pack bytes-like object into node of given type."""
+        return self._buffer_node(
+            obj_type, _BYTES_ENCODERS[self._bytes_encoding](obj))
+
+    def _buffer_node(self, obj_type: str, value: 'str | bytes') -> Dict:
+        """Create node of given type for encoded bytes."""
+        data = {'type': obj_type, 'value': value}
+        if self._bytes_encoding != 'base64':
+            data['encoding'] = self._bytes_encoding
         return data
 
+    def _pack_bytes(self, obj: bytes) -> Dict:
+        return self._pack_buffer('bytes', obj)
+
+    def _pack_bytearray(self, obj: bytearray) -> Dict:
+        return self._pack_buffer('bytearray', obj)
+
+    def _pack_memoryview(self, obj: memoryview) -> Dict:
+        data = self._pack_buffer('memoryview',
+                                 obj if obj.c_contiguous else obj.tobytes())
+        data['format'] = obj.format
+        if obj.ndim != 1:
+            data['shape'] = [str(size) for size in cast(tuple, obj.shape)]
+        return data
+
+    def _pack_array(self, obj: array) -> Dict:
+        return {'type': 'array', 'dtype': obj.typecode,
+                'value': _array_to_str(obj)}
+
+    def _pack_range(self, obj: range) -> Dict:
+        return {'type': 'range',
+                'start': self._pack_int(obj.start),
+                'stop': self._pack_int(obj.stop),
+                'step': self._pack_int(obj.step)}
+
+    def _pack_cell(self, obj: CellType, stack: list) -> Dict:
+        data = {'type': 'cell', 'value': obj.cell_contents}
+        stack.append([data, 0, ('value',)])
+        return data
+
+    def _pack_module(self, obj: ModuleType) -> Dict:
+        return {'type': 'module',
+                'name': self._pack_str(obj.__name__)}
+
+    def _pack_function(self, obj: FunctionType, stack: list) -> Dict:
+        data = {'type': 'function',
+                'doc': obj.__doc__,
+                'name': self._pack_str(obj.__name__),
+                'code': self._pack_code(obj.__code__),
+                'defaults': obj.__defaults__,
+                'closure': obj.__closure__}
+        stack.append([data, 0, ('doc', 'defaults', 'closure')])
+        return data
+
+    def _pack_code(self, obj: CodeType) -> Dict:
+        cache = self._pack_code_cache
+        key = (id(obj), self._bytes_encoding)
+        entry = cache.get(key)
+        if entry is not None:
+            return self._buffer_node('bytes', entry[1])
+        data = self._pack_bytes(marshal.dumps(obj))
+        cache.set(key, (obj, data['value']))
+        return data
+
+    def _pack_plain_value(self, obj) -> Any:
+        return obj
+
+    def _pack_plain_int(self, obj: int) -> 'int | Dict':
+        if -_PLAIN_INT_MAX <= obj <= _PLAIN_INT_MAX:
+            return obj
+        return self._pack_int(obj)
+
+    def _pack_plain_float(self, obj: float) -> 'float | Dict':
+        if math.isfinite(obj):
+            return obj
+        return self._pack_float(obj)
+
+    def _pack_plain_dict(self, obj: dict, stack: list) -> Dict:
+        if 'type' in obj or any(type(key) is not str for key in obj):
+            return self._pack_dict(obj, stack)
+        data = dict(obj)
+        stack.append([data, 0, tuple(data)])
+        return data
+
+    def _pack_plain_list(self, obj: list, stack: list) -> List:
+        return self._pack_items(list(obj), stack)
+
+    _pack_leaf_dispatch: Dict[type, Callable[['Packer', Any], Any]] = {
+        type(None): _pack_none,
+        str: _pack_str,
+        int: _pack_int,
+        float: _pack_float,
+        complex: _pack_complex,
+        bool: _pack_bool,
+        bytes: _pack_bytes,
+        bytearray: _pack_bytearray,
+        memoryview: _pack_memoryview,
+        range: _pack_range,
+        array: _pack_array,
+        ModuleType: _pack_module,
+    }
+
+    _pack_dispatch: Dict[type, Callable[['Packer', Any, list], Any]] = {
+        dict: _pack_dict,
+        list: _pack_list,
+        tuple: _pack_tuple,
+        set: _pack_set,
+        frozenset: _pack_frozenset,
+        CellType: _pack_cell,
+        FunctionType: _pack_function,
+    }
+
+    _pack_plain_leaf_dispatch: Dict[type, Callable[['Packer', Any], Any]] = {
+        **_pack_leaf_dispatch,
+        type(None): _pack_plain_value,
+        str: _pack_plain_value,
+        int: _pack_plain_int,
+        float: _pack_plain_float,
+        bool: _pack_plain_value,
+    }
+
+    _pack_plain_dispatch: Dict[type,
+                               Callable[['Packer', Any, list], Any]] = {
+        **_pack_dispatch,
+        dict: _pack_plain_dict,
+        list: _pack_plain_list,
+    }
+
     def unpack(self, data: 'Dict[str, str | List[Dict] | Dict]') -> Any:
-        """Pack object from one dict."""
-        obj_type = str(data['type'])
-        if obj_type == 'None':
-            return None
-        elif obj_type == 'bool':
-            return True if data['value'] == 'True' else False
-        elif obj_type in ('str', 'int', 'float', 'complex', 'bool'):
-            callable = cast(Callable, locate(obj_type))
-            return callable(data['value'])
-        elif obj_type in ('tuple', 'list', 'dict', 'set', 'frozenset'):
-            callable = cast(Callable, locate(obj_type))
-            return callable(map(self.unpack,
-                                cast(List[Dict], data['value'])))
-        elif obj_type in ('bytes', 'bytearray'):
-            result = b64decode(self.unpack(cast(Dict, data['value'])))
-            if obj_type == 'bytearray':
-                return bytearray(result)
-            return result
-        elif obj_type == 'range':
-            start = self.unpack(cast(Dict, data['start']))
-            stop = self.unpack(cast(Dict, data['stop']))
-            step = self.unpack(cast(Dict, data['step']))
-            return range(start, stop, step)
-        elif obj_type == 'cell':
-            cell_contents = self.unpack(cast(Dict, data['value']))
-            return _make_cell(cell_contents)
-        elif obj_type == 'module':
-            name = self.unpack(cast(Dict, data['name']))
-            name = cast(str, name)
-            return __import__(name, self.globals)
-        elif obj_type == 'function':
+        """Unpack object from one dict."""
+        return self._unpack(data, [], 0)
+
+    def unpack_items(self, nodes: Iterable, shared: bool = True
+                     ) -> Iterator[Any]:
+        """Unpack items of a packed list one by one.
+
+        Each item is unpacked from its node when the previous one is
+        consumed.
+
+        Args:
+            nodes (iterable): nodes of the list items, e.g. the 'value'
+            of a packed list.
+            shared (bool, optional): whether items may reference objects
+            of previous items (such as one tuple put into each of them).
+            If so, unpacked containers are kept to resolve references.
+            Otherwise nothing is kept, so only one item is in memory
+            at a time.
+
+        Raises:
+            ValueError: if an item references the list or, unless shared
+            is True, an object of another item.
+        """
+        memo: list = []
+        # The list itself takes the first index in the memo.
+        base = 1
+        for node in nodes:
+            if shared:
+                yield self._unpack(node, memo, base)
+            else:
+                memo = []
+                value = self._unpack(node, memo, base)
+                base += len(memo)
+                yield value
+
+    def _unpack(self, data: Any, memo: list, base: int) -> Any:
+        """Unpack object from one node.
+
+        Args:
+            data: the node.
+            memo (list): unpacked containers, the containers of the node
+            are appended to it.
+            base (int): memo index of the first container in memo;
+            references to lower indexes cannot be resolved.
+        """
+        leaves = self._unpack_leaf_dispatch
+        dispatch = self._unpack_dispatch
+        plain = self._plain
+        # Maps memo indexes of objects being unpacked to (frame, position)
+        # of references to them, which are to be patched later.
+        fixups: Dict[int, List[Tuple[_UnpackFrame, int]]] = {}
+        stack = [_UnpackFrame([data], lambda results: results[0])]
+        while True:
+            frame = stack[-1]
+            nodes, results = frame.nodes, frame.results
+            for pos in range(len(results), len(nodes)):
+                node = nodes[pos]
+                if plain and (type(node) is not dict or 'type' not in node):
+                    obj_type = type(node)
+                else:
+                    obj_type = node['type']
+                handler = leaves.get(obj_type)
+                if handler is not None:
+                    results.append(handler(self, node))
+                    continue
+                if obj_type == 'ref':
+                    index = int(node['value']) - base
+                    if not 0 <= index < len(memo):
+                        if index < 0 <= index + base:
+                            raise ValueError('The object referencing '
+                                             'an object out of the node '
+                                             'cannot be unpacked')
+                        raise ValueError(f'Invalid reference '
+                                         f'"{node["value"]}"')
+                    value = memo[index]
+                    if value is _PENDING:
+                        if frame.patch is None:
+                            raise ValueError('The object referencing its '
+                                             'immutable container '
+                                             'cannot be unpacked')
+                        fixups.setdefault(index, []).append((frame, pos))
+                        value = None
+                    results.append(value)
+                    continue
+                handler = dispatch.get(obj_type)
+                if handler is None:
+                    raise NotImplementedError(f'The object of type '
+                                              f'"{obj_type}" '
+                                              'cannot be unpacked')
+                child = handler(self, node)
+                child.index = len(memo)
+                memo.append(child.obj)
+                stack.append(child)
+                break
+            else:
+                stack.pop()
+                if frame.obj is _PENDING:
+                    value = frame.finish(results)
+                else:
+                    frame.finish(results)
+                    value = frame.obj
+                if frame.index is not None:
+                    memo[frame.index] = value
+                    for ref_frame, ref_pos in fixups.pop(frame.index, ()):
+                        cast(Callable, ref_frame.patch)(ref_frame, ref_pos,
+                                                        value)
+                if not stack:
+                    return value
+                stack[-1].results.append(value)
+
+    def _unpack_none(self, data: Dict) -> None:
+        return None
+
+    def _unpack_str(self, data: Dict) -> str:
+        return str(data['value'])
+
+    def _unpack_int(self, data: Dict) -> int:
+        return int(data['value'], 0)
+
+    def _unpack_float(self, data: Dict) -> float:
+        return float(data['value'])
+
+    def _unpack_complex(self, data: Dict) -> complex:
+        return complex(data['value'])
+
+    def _unpack_bool(self, data: Dict) -> bool:
+        return data['value'] == 'True'
+
+    def _unpack_items(self, nodes: List[Dict], finish: Callable[[list], Any],
+                      obj: Any = _PENDING,
+                      patch: 'Callable | None' = None) -> _UnpackFrame:
+        """Create frame for nodes, unpacking leading leaves immediately."""
+        leaves = self._unpack_leaf_dispatch
+        results: list = []
+        plain = self._plain
+        for node in nodes:
+            if plain and (type(node) is not dict or 'type' not in node):
+                handler = leaves.get(type(node))
+            else:
+                handler = leaves.get(node['type'])
+            if handler is None:
+                break
+            results.append(handler(self, node))
+        return _UnpackFrame(nodes, finish, results, obj, patch)
+
+    def _unpack_dict(self, data: Dict) -> _UnpackFrame:
+        nodes = []
+        for item in cast(List[Dict], data['value']):
+            if (item['type'] not in ('tuple', 'list')
+                    or len(item['value']) != 2):
+                raise ValueError('Dict items must be packed pairs')
+            nodes.extend(item['value'])
+        return self._unpack_pairs(nodes)
+
+    def _unpack_pairs(self, nodes: list) -> _UnpackFrame:
+        """Create frame for nodes of dict keys interleaved with values."""
+        obj: dict = {}
+
+        def finish(results: list) -> None:
+            obj.update(zip(results[::2], results[1::2]))
+
+        return self._unpack_items(nodes, finish, obj, _patch_dict)
+
+    def _unpack_plain_value(self, data) -> Any:
+        return data
+
+    def _unpack_constant(self, data: ConstantNode) -> Any:
+        return self._unpack_leaf_dispatch[data['type']](self, data)
+
+    def _unpack_plain_dict(self, data: Dict) -> _UnpackFrame:
+        return self._unpack_pairs([node for item in data.items()
+                                   for node in item])
+
+    def _unpack_plain_list(self, data: List) -> _UnpackFrame:
+        obj: list = []
+        return self._unpack_items(data, obj.extend, obj, _patch_list)
+
+    def _unpack_list(self, data: Dict) -> _UnpackFrame:
+        if 'dtype' in data:
+            values = _array_from_str(cast(str, data['dtype']),
+                                     cast(str, data['value'])).tolist()
+            return _UnpackFrame([], values.extend, obj=values)
+        obj: list = []
+        return self._unpack_items(cast(List[Dict], data['value']),
+                                  obj.extend, obj, _patch_list)
+
+    def _unpack_tuple(self, data: Dict) -> _UnpackFrame:
+        return self._unpack_items(cast(List[Dict], data['value']), tuple)
+
+    def _unpack_set(self, data: Dict) -> _UnpackFrame:
+        obj: set = set()
+        return self._unpack_items(cast(List[Dict], data['value']),
+                                  obj.update, obj)
+
+    def _unpack_frozenset(self, data: Dict) -> _UnpackFrame:
+        return self._unpack_items(cast(List[Dict], data['value']), frozenset)
+
+    def _unpack_bytes(self, data: Dict) -> bytes:
+        value = data['value']
+        if type(value) is dict:
+            # Bytes used to be packed with their base64 in a str node.
+            value = self._unpack_str(value)
+        decoder = _BYTES_DECODERS.get(data.get('encoding', 'base64'))
+        if decoder is None:
+            raise ValueError(f'Unknown bytes encoding "{data["encoding"]}"')
+        return decoder(value)
+
+    def _unpack_bytearray(self, data: Dict) -> bytearray:
+        return bytearray(self._unpack_bytes(data))
+
+    def _unpack_memoryview(self, data: Dict) -> memoryview:
+        view: Any = memoryview(self._unpack_bytes(data))
+        if 'shape' not in data:
+            return view.cast(data['format'])
+        return view.cast(data['format'],
+                         [int(size) for size in data['shape']])
+
+    def _unpack_array(self, data: Dict) -> array:
+        return _array_from_str(cast(str, data['dtype']),
+                               cast(str, data['value']))
+
+    def _unpack_range(self, data: Dict) -> range:
+        start = self._unpack_int(cast(Dict, data['start']))
+        stop = self._unpack_int(cast(Dict, data['stop']))
+        step = self._unpack_int(cast(Dict, data['step']))
+        return range(start, stop, step)
+
+    def _unpack_cell(self, data: Dict) -> _UnpackFrame:
+        obj = CellType()
+
+        def finish(results: list) -> None:
+            obj.cell_contents = results[0]
+
+        return _UnpackFrame([cast(Dict, data['value'])], finish, obj=obj,
+                            patch=_patch_cell)
+
+    def _unpack_module(self, data: Dict) -> ModuleType:
+        name = self._unpack_str(cast(Dict, data['name']))
+        return __import__(name, self.globals)
+
+    def _unpack_function(self, data: Dict) -> _UnpackFrame:
+        name = self._unpack_str(cast(Dict, data['name']))
+        code = self._unpack_code(cast(Dict, data['code']))
+        nodes = [cast(Dict, data[key])
+                 for key in ('doc', 'defaults', 'closure')]
+
+        def finish(results: list) -> FunctionType:
+            doc, defaults, closure = results
             globals = self.globals
             if globals is None:
                 globals = builtins.globals()
-            doc = self.unpack(cast(Dict, data['doc']))
-            name = self.unpack(cast(Dict, data['name']))
-            code_marshalled = self.unpack(cast(Dict, data['code']))
-            code = marshal.loads(code_marshalled)
-            defaults = self.unpack(cast(Dict, data['defaults']))
-            closure = self.unpack(cast(Dict, data['closure']))
             func = FunctionType(code, globals, name, defaults, closure)
             func.__doc__ = doc
             return func
-        else:
-            raise NotImplementedError(f'The object of type "{obj_type}" '
-                                      'cannot be unpacked')
+
+        return _UnpackFrame(nodes, finish)
+
+    def _unpack_code(self, data: Dict) -> CodeType:
+        value = data['value']
+        if type(value) is not str:
+            return marshal.loads(self._unpack_bytes(data))
+        cache = self._unpack_code_cache
+        key = (data.get('encoding', 'base64'), value)
+        code = cache.get(key)
+        if code is None:
+            code = marshal.loads(self._unpack_bytes(data))
+            cache.set(key, code)
+        return code
+
+    _unpack_leaf_dispatch: Dict[Any, Callable[['Packer', Any], Any]] = {
+        'None': _unpack_none,
+        'str': _unpack_str,
+        'int': _unpack_int,
+        'float': _unpack_float,
+        'complex': _unpack_complex,
+        'bool': _unpack_bool,
+        'bytes': _unpack_bytes,
+        'bytearray': _unpack_bytearray,
+        'memoryview': _unpack_memoryview,
+        'range': _unpack_range,
+        'array': _unpack_array,
+        'module': _unpack_module,
+    }
+
+    _unpack_dispatch: Dict[Any, Callable[['Packer', Any], _UnpackFrame]] = {
+        'dict': _unpack_dict,
+        'list': _unpack_list,
+        'tuple': _unpack_tuple,
+        'set': _unpack_set,
+        'frozenset': _unpack_frozenset,
+        'cell': _unpack_cell,
+        'function': _unpack_function,
+    }
+
+    _unpack_plain_leaf_dispatch: Dict[Any,
+                                      Callable[['Packer', Any], Any]] = {
+        **_unpack_leaf_dispatch,
+        type(None): _unpack_plain_value,
+        str: _unpack_plain_value,
+        int: _unpack_plain_value,
+        float: _unpack_plain_value,
+        bool: _unpack_plain_value,
+        ConstantNode: _unpack_constant,
+    }
+
+    _unpack_plain_dispatch: Dict[Any, Callable[['Packer', Any],
+                                               _UnpackFrame]] = {
+        **_unpack_dispatch,
+        dict: _unpack_plain_dict,
+        list: _unpack_plain_list,
+    }
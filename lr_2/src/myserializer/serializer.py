@@ -22,9 +22,13 @@ class Serializer(ABC):
         must be deserialized using that specific version of Python.
     """
 
+    binary = False
+    """Whether dump and load work with BinaryIO, dumps and loads
+    with bytes, rather than with TextIO and str."""
+
     _globals = None
 
-    def __init__(self, globals: Dict[str, Any] = None) -> None:
+    def __init__(self, globals: 'Dict[str, Any] | None' = None) -> None:
         """__init__ method.
 
         Args:
@@ -6,24 +6,34 @@ It primarily targets testing serializers implemented by myserializer module.
 Attributes:
     test_basic (list): A list of test inputs, including
     basic types such as int, float, complex, bool, dict, list, set, frozenset,
-    tuple, range, bytes, bytearray, str.
+    tuple, range, bytes, bytearray, memoryview, str, array, lists of numbers,
+    and containers sharing references.
 
     test_funcs_with_args (list): A list of tuples, where the first element is
     a function, and the second one is a list of test argument tuples.
 """
+from array import array
 from types import FunctionType
 from typing import List, Tuple
 
 import serialization_func_tests_dummy
 
 _int_tests: list = [
-    1, 2, 12, 13434, -134134, 0, 7
+    1, 2, 12, 13434, -134134, 0, 7, 2 ** 64 - 1, -2 ** 64,
+    (7 ** 20000, -1 << 100000)
 ]
 
 _bool_tests: list = [
     True, False, (False, True), [True, (1, 2, 'k9')]
 ]
 
+_shared_list: list = [1, 'shared']
+
+_shared_tests: list = [
+    [_shared_list, (_shared_list, {'a': _shared_list}), _shared_list],
+    ((), ((), frozenset(), frozenset()))
+]
+
 _dict_tests: list = [
     {1: 2}, {'a': 'b'}, {None: 'ok'},
     {'key': 'value', 123: 456, 12.3: 4.56, (1.4j + 3): "that's complex!",
@@ -37,16 +47,27 @@ _set_tests: list = [
 ]
 
 _range_tests: list = [
-    range(100), range(0, 1, 2), range(25, -10, -1)
+    range(100), range(0, 1, 2), range(25, -10, -1),
+    range(-2 ** 70, 2 ** 80, 3 ** 50)
 ]
 
 _bytes_tests: list = [
     b'\x00\x01\x02 abc 123 \n\r -- \x93', b'123', b'bytes',
-    bytearray(b'123'), bytearray((1, 2, 5, 3, 2, 6, 235, 12, 123))
+    bytearray(b'123'), bytearray((1, 2, 5, 3, 2, 6, 235, 12, 123)),
+    memoryview(b'view'), memoryview(bytes(range(24))).cast('i', (2, 3))
+]
+
+_number_list: list = list(range(-50, 50))
+
+_array_tests: list = [
+    _number_list, [i / 3 for i in range(20)], [-0.0, 1e300] * 10,
+    [2 ** 70] * 20, [1] * 20 + [1.0], [True] * 20, [_number_list] * 20,
+    array('i', range(-5, 5)), array('d', [0.5, -1.5]), array('b'),
+    array('H', [0, 1, 65535])
 ]
 
 test_basic: list = _int_tests + _bool_tests + _dict_tests + \
-    _set_tests + _range_tests + _bytes_tests
+    _set_tests + _range_tests + _bytes_tests + _array_tests + _shared_tests
 
 
 def _get_test_funcs() -> list:
@@ -99,6 +120,11 @@ def _get_test_funcs() -> list:
                 return _a(a * b, default - arg)
         return _b
 
+    def _get_func_6():
+        def fact(n):
+            return 1 if n <= 1 else n * fact(n - 1)
+        return fact
+
     import math
 
     def _test_func_5(a, b, c):
@@ -112,6 +138,7 @@ def _get_test_funcs() -> list:
         (_get_func_3(), [(1,), (7,), (-64, 4), (10, 5), (25,)]),
         (_get_func_4(), [(12,), (4,), (-4, 5), (1, 56), (12,)]),
         (_test_func_5, [(1, 3, 5), (-1, -3, 4), (4.2, 23.4, 2345.3)]),
+        (_get_func_6(), [(x,) for x in [0, 1, 5, 20]]),
         (serialization_func_tests_dummy._t, [(x,) for x in [-1, 13, 27, 17.4]])
     ]
 
@@ -10,18 +10,33 @@ Attributes:
     listed in implemented_formats. Serializers are created by calling
     myserializer.create_serializer(format).
 
+    plain_serializers (list): A list of serializers that pack objects
+    in plain mode.
+
+    compressed_serializers (list): A list of serializers wrapped into
+    CompressedSerializer, one for each compression.
+
     not_implemented_formats (list):A list of strings, representing formats
     that are not expected to be implemented by myserializer.
 """
 import myserializer
+from myserializer.my_json import JsonSerializer
 
 implemented_formats = [
-    'yaml', 'toml', 'json'
+    'yaml', 'toml', 'json', 'binary'
 ]
 
 serializers = list(map(myserializer.create_serializer,
                        implemented_formats))
 
+plain_serializers = [JsonSerializer(plain=True)]
+
+compressed_serializers = [
+    myserializer.create_serializer('json', 'gzip'),
+    myserializer.create_serializer('yaml', 'bz2'),
+    myserializer.create_serializer('binary', 'lzma')
+]
+
 not_implemented_formats = [
     'xml', 'bson'
 ]
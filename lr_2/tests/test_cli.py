@@ -99,3 +99,36 @@ def test_main_json_json_same_file(capsys):
         pass
     finally:
         os.remove(filename)
+
+
+def test_main_json_binary(capsys, tmp_path):
+    """Test CLI with binary format: json -> binary -> json."""
+    json_path = tmp_path / 'value.json'
+    binary_path = tmp_path / 'value.bin'
+    initial_val = {'a': [1, 2.5, b'\x00\xff']}
+    json_serializer = myserializer.create_serializer('json')
+    json_path.write_text(json_serializer.dumps(initial_val))
+    cli.main(f'-i {json_path} -o {binary_path} -if json -of binary'.split())
+    binary_serializer = myserializer.create_serializer('binary')
+    assert binary_serializer.loads(binary_path.read_bytes()) == initial_val
+    cli.main(f'-i {binary_path} -o {json_path} -if binary -of json'.split())
+    assert json_serializer.loads(json_path.read_text()) == initial_val
+    out, err = capsys.readouterr()
+    assert err == ''
+    assert out.count('Success') == 2
+
+
+def test_main_compression(capsys, tmp_path):
+    """Test CLI with compressed files: json gzip -> yaml lzma."""
+    json_path = tmp_path / 'value.json.gz'
+    yaml_path = tmp_path / 'value.yaml.xz'
+    initial_val = {'a': [1, 2.5, 'text']}
+    json_path.write_bytes(
+        myserializer.create_serializer('json', 'gzip').dumps(initial_val))
+    cli.main(f'-i {json_path} -o {yaml_path} -if json -of yaml '
+             '-ic gzip -oc lzma'.split())
+    yaml_serializer = myserializer.create_serializer('yaml', 'lzma')
+    assert yaml_serializer.loads(yaml_path.read_bytes()) == initial_val
+    out, err = capsys.readouterr()
+    assert err == ''
+    assert 'Success' in out
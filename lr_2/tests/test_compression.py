@@ -0,0 +1,76 @@
+"""compression tests.
+
+This module provides a number of tests to be used by PyTest.
+It targets testing myserializer.compression module:
+- Checking if compressed output is the output of the wrapped serializer;
+- Checking if data is compressed while being dumped;
+- Checking if unknown compressions raise ValueError.
+"""
+import bz2
+import gzip
+import io
+import lzma
+
+import pytest
+from myserializer import create_serializer
+from myserializer.compression import CompressedSerializer
+from myserializer.my_json import JsonSerializer
+
+_DECOMPRESS = {
+    'gzip': gzip.decompress,
+    'bz2': bz2.decompress,
+    'lzma': lzma.decompress
+}
+
+
+@pytest.mark.parametrize('compression', ['gzip', 'bz2', 'lzma'])
+@pytest.mark.parametrize('serializer_type', ['json', 'binary'])
+def test_compressed_output(compression: str, serializer_type: str):
+    """test_compressed_output function.
+
+    Checks that the output of CompressedSerializer decompresses to
+    the output of the wrapped serializer, is the same each time and
+    is much smaller for repetitive data.
+    """
+    test_input = [{'id': i, 'tags': ('a', 'b')} for i in range(1000)]
+    serializer = create_serializer(serializer_type, compression)
+    inner = create_serializer(serializer_type)
+    compressed = serializer.dumps(test_input)
+    expected = inner.dumps(test_input)
+    if not inner.binary:
+        expected = expected.encode()
+    assert _DECOMPRESS[compression](compressed) == expected
+    assert serializer.dumps(test_input) == compressed
+    assert len(compressed) * 5 < len(expected)
+    assert serializer.loads(compressed) == test_input
+
+
+def test_incremental_compression():
+    """test_incremental_compression function.
+
+    Checks that compressed data is written while the object is dumped,
+    not at once.
+    """
+    class CountingIO(io.BytesIO):
+        writes = 0
+
+        def write(self, data):
+            self.writes += 1
+            return super().write(data)
+
+    test_input = [str(i) for i in range(200_000)]
+    serializer = CompressedSerializer(JsonSerializer(), 'gzip', level=1)
+    with CountingIO() as stream:
+        serializer.dump(test_input, stream)
+        assert stream.writes > 1
+        stream.seek(0)
+        assert serializer.load(stream) == test_input
+
+
+def test_unknown_compression():
+    """test_unknown_compression function.
+
+    Checks that unknown compressions raise ValueError.
+    """
+    with pytest.raises(ValueError):
+        create_serializer('json', 'zip')
@@ -0,0 +1,71 @@
+"""my_binary tests.
+
+This module provides a number of tests to be used by PyTest.
+It targets testing myserializer.my_binary module:
+- Checking if encoded objects are decoded unchanged;
+- Checking if scalars are stored natively and repeated strs by index;
+- Checking if invalid binary data raises ValueError.
+"""
+import pytest
+from myserializer.my_binary.decoder import BinaryDecoder
+from myserializer.my_binary.encoder import MAGIC, BinaryEncoder
+from myserializer.packer import ConstantNode
+
+from encoding_inputs import test_inputs
+
+_scalars: list = [
+    None, True, False, 0, -1, 127, -128, 128, -32769, 2 ** 31, -2 ** 63,
+    2 ** 63, -2 ** 64 - 1, 7 ** 500, 0.5, -0.0, float('inf'), 1e300,
+    '\ud83d lone surrogate', 'x' * 300, b'', b'\x00\xff' * 200
+]
+
+
+@pytest.mark.parametrize('test_input', test_inputs + _scalars + [
+    _scalars, {'a': _scalars, 'b': {'c': [[]], 'd': {}}},
+    [str(i) for i in range(1000)] * 2, [[[[[1]]]]] * 3
+])
+def test_encode_decode(test_input):
+    """test_encode_decode function.
+
+    Checks that BinaryDecoder decodes objects encoded by BinaryEncoder,
+    including big ints, long strs and more than 256 repeated strs.
+    """
+    encoded = BinaryEncoder().encode(test_input)
+    assert encoded.startswith(MAGIC)
+    decoded = BinaryDecoder().decode(encoded)
+    assert decoded == test_input
+    assert type(decoded) is type(test_input)
+    assert BinaryDecoder().decode(memoryview(encoded)) == test_input
+
+
+def test_compact_encoding():
+    """test_compact_encoding function.
+
+    Checks that small ints and floats take a tag and their bytes,
+    repeated strs take a tag and an index, and constant nodes
+    are encoded as dicts.
+    """
+    assert BinaryEncoder().encode(5) == MAGIC + b'b\x05'
+    assert len(BinaryEncoder().encode(0.1)) == len(MAGIC) + 9
+    assert BinaryEncoder().encode(['key', 'key']) \
+        == MAGIC + b'l\x02s\x03keyr\x00'
+    node = ConstantNode(type='None')
+    assert BinaryEncoder().encode(node) == BinaryEncoder().encode(dict(node))
+    with pytest.raises(NotImplementedError):
+        BinaryEncoder().encode((1, 2))
+
+
+@pytest.mark.parametrize('test_input', [
+    b'', b'{"a": 1}', MAGIC, MAGIC + b'l\x02N', MAGIC + b's\x05abc',
+    MAGIC + b'NN', MAGIC + b'?', MAGIC + b'r\x00', MAGIC + b'q\x01',
+    MAGIC + b'm\x01l\x00N', MAGIC + b's\x01\xff'
+])
+def test_invalid_binary(test_input):
+    """test_invalid_binary function.
+
+    Checks that BinaryDecoder raises ValueError if the data does not
+    start with MAGIC, is truncated, has extra data, unknown tags,
+    unknown str indexes, unhashable keys or invalid UTF-8.
+    """
+    with pytest.raises(ValueError):
+        BinaryDecoder().decode(test_input)
@@ -4,13 +4,22 @@ This module provides a number of tests to be used by PyTest.
 It targets testing myserializer.my_json module:
 - Checking if my_json output is compatible with json;
 - Checking if json output can be decoded by my_json;
-- Checking is my_json can work with custom separators.
+- Checking is my_json can work with custom separators;
+- Checking if numbers, booleans and null are encoded and decoded;
+- Checking if constant nodes are encoded as dicts;
+- Checking if JsonEncoder encodes big and deep objects by chunks;
+- Checking if all chars that must be escaped are escaped.
 """
+import io
 import json
+import math
 
 import pytest
-from myserializer.my_json.decoder import JsonDecoder
+from myserializer.my_json import decoder as decoder_module
+from myserializer.my_json.decoder import (IncrementalJsonDecoder, JsonDecoder,
+                                          JsonScanner, build_items)
 from myserializer.my_json.encoder import JsonEncoder
+from myserializer.packer import ConstantNode
 
 from encoding_inputs import test_inputs
 
@@ -95,3 +104,253 @@ def test_invalid_separators(test_separators):
     """
     with pytest.raises(ValueError):
         JsonDecoder(separators=test_separators)
+
+
+@pytest.mark.parametrize('test_input', [
+    [0, -1, 12345678901234567890, 2.5, -1e-07, 1e+300],
+    {'a': True, 'b': False, 'c': None}, 7, -0.5, [[1], {'x': 2}]
+])
+def test_plain_values(test_input):
+    """test_plain_values function.
+
+    Tests both JsonEncoder and JsonDecoder on numbers, booleans and null
+    by comparing their results with those of json.
+    """
+    encoder = JsonEncoder()
+    decoder = JsonDecoder()
+    assert encode_loads(test_input, encoder) == test_input
+    assert dumps_decode(test_input, decoder) == test_input
+    assert decoder.decode(json.dumps(test_input, indent=2)) == test_input
+
+
+@pytest.mark.parametrize('test_input', [
+    '01', '1.', '-', '1e', '+1', 'nul', 'True', '[1 2]', '', '"a', '[1,',
+    '{1:2}', '{"a" 1}', '[1,]', '{"a":1,}'
+])
+def test_invalid_values(test_input):
+    """test_invalid_values function.
+
+    Checks that JsonDecoder raises ValueError on invalid literals.
+    """
+    with pytest.raises(ValueError):
+        JsonDecoder().decode(test_input)
+
+
+@pytest.mark.parametrize('test_input', [math.nan, math.inf, [-math.inf]])
+def test_not_finite_floats(test_input):
+    """test_not_finite_floats function.
+
+    Checks that JsonEncoder raises ValueError on floats
+    that are not finite.
+    """
+    with pytest.raises(ValueError):
+        JsonEncoder().encode(test_input)
+
+
+@pytest.mark.parametrize('test_separators', [None, (', ', ': ')])
+def test_constant_nodes(test_separators):
+    """test_constant_nodes function.
+
+    Checks that JsonEncoder encodes constant nodes as dicts,
+    including repeated ones.
+    """
+    node = ConstantNode(type='int', value='1')
+    test_input = {'a': [node, node], 'b': node}
+    expected = {'a': [dict(node), dict(node)], 'b': dict(node)}
+    encoder = JsonEncoder(separators=test_separators)
+    assert encoder.encode(test_input) == encoder.encode(expected)
+    assert encode_loads(test_input, encoder) == expected
+
+
+def test_iterencode():
+    """test_iterencode function.
+
+    Checks that JsonEncoder.iterencode yields the text of big objects
+    by several chunks and encodes deeply nested objects.
+    """
+    encoder = JsonEncoder()
+    test_input = [{'key': [str(i), i]} for i in range(10000)]
+    chunks = list(encoder.iterencode(test_input))
+    assert len(chunks) > 1
+    assert ''.join(chunks) == encoder.encode(test_input)
+    assert json.loads(''.join(chunks)) == test_input
+    depth = 100000
+    test_input = []
+    for _ in range(depth):
+        test_input = [{'a': test_input}]
+    assert encoder.encode(test_input) == '[{"a":' * depth + '[]' + \
+        '}]' * depth
+
+
+@pytest.mark.parametrize('test_input', [
+    ''.join(map(chr, range(0x80))), 'no escapes \u1337', '\\"\\',
+    '\x7f' * 3 + '\n'
+])
+def test_escaping(test_input):
+    """test_escaping function.
+
+    Checks that JsonEncoder escapes control chars, quotes and backslashes,
+    so that its output is decoded by json and JsonDecoder.
+    """
+    encoded = JsonEncoder().encode(test_input)
+    assert all(ch >= ' ' and ch != '\x7f' for ch in encoded)
+    assert json.loads(encoded) == test_input
+    assert JsonDecoder().decode(encoded) == test_input
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7])
+def test_chunked_decoding(chunk_size, monkeypatch):
+    """test_chunked_decoding function.
+
+    Checks that JsonDecoder decodes TextIO read by small chunks
+    and UTF-8 bytes decoded by small chunks, so that strs, escapes,
+    numbers, literals and multibyte chars are split between chunks.
+    """
+    monkeypatch.setattr(decoder_module, '_CHUNK_SIZE', chunk_size)
+    test_input = {'key': ['a\\b\n\u1337"\U0001f600', -1.5e-07, 12345,
+                          True, None, {'': False}, []]}
+    decoder = JsonDecoder()
+    for text in (json.dumps(test_input), json.dumps(test_input, indent=1),
+                 json.dumps(test_input, ensure_ascii=False)):
+        assert decoder.decode(io.StringIO(text)) == test_input
+        data = text.encode()
+        assert decoder.decode(data) == test_input
+        assert decoder.decode(memoryview(data)) == test_input
+    assert decoder.decode(io.StringIO('1234')) == 1234
+    with pytest.raises(ValueError):
+        decoder.decode(io.StringIO('"abc'))
+
+
+@pytest.mark.parametrize('test_input, expected', [
+    ('"\\ud83d\\ude00"', '\U0001f600'),
+    ('"\\uD83D\\uDE00\\u0041"', '\U0001f600A'),
+    ('"\\ud83d"', '\ud83d'),
+    ('"\\ud83d\\u0041"', '\ud83dA'),
+    ('"\\ude00\\ud83d"', '\ude00\ud83d'),
+    ('"\\/\\b\\f\\t\\q"', '/\b\f\tq')
+])
+def test_str_escapes(test_input, expected):
+    """test_str_escapes function.
+
+    Checks that JsonDecoder joins surrogate pairs of \\uXXXX escapes
+    and keeps lone surrogates.
+    """
+    assert JsonDecoder().decode(test_input) == expected
+
+
+@pytest.mark.parametrize('test_input', ['"\\u12g4"', '"\\u12"', '"\\'])
+def test_invalid_str_escapes(test_input):
+    """test_invalid_str_escapes function.
+
+    Checks that JsonDecoder raises ValueError on invalid escapes.
+    """
+    with pytest.raises(ValueError):
+        JsonDecoder().decode(test_input)
+
+
+def test_deep_decoding():
+    """test_deep_decoding function.
+
+    Checks that JsonDecoder decodes deeply nested objects.
+    """
+    depth = 100000
+    expected = []
+    for _ in range(depth):
+        expected = [{'a': expected}]
+    decoded = JsonDecoder().decode(JsonEncoder().encode(expected))
+    for _ in range(depth):
+        assert type(decoded) is list and len(decoded) == 1
+        decoded = decoded[0]['a']
+    assert decoded == []
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 5, 1000])
+def test_incremental_decoding(chunk_size):
+    """test_incremental_decoding function.
+
+    Checks that IncrementalJsonDecoder decodes many objects from UTF-8
+    bytes fed by chunks, returning each object as soon as it is complete.
+    """
+    test_inputs = [{'a': ['\u1337 \U0001f600', 1.5]}, [], 'str', None, -7]
+    data = ''.join(json.dumps(obj, ensure_ascii=False) + '\n'[:i % 2]
+                   for i, obj in enumerate(test_inputs)).encode()
+    decoder = IncrementalJsonDecoder()
+    decoded = []
+    for start in range(0, len(data), chunk_size):
+        decoded += decoder.feed(data[start:start + chunk_size])
+    # The last number may go on, so it ends with the text.
+    assert decoded == test_inputs[:-1]
+    assert decoder.close() == test_inputs[-1:]
+    with pytest.raises(ValueError):
+        decoder.feed('[]')
+
+
+def test_incremental_decoding_errors():
+    """test_incremental_decoding_errors function.
+
+    Checks that IncrementalJsonDecoder raises ValueError on invalid text
+    and on text ending inside of an object.
+    """
+    decoder = IncrementalJsonDecoder()
+    assert decoder.feed('[1, 2') == []
+    with pytest.raises(ValueError):
+        decoder.close()
+    decoder = IncrementalJsonDecoder()
+    with pytest.raises(ValueError):
+        decoder.feed('[1] [2}')
+    with pytest.raises(ValueError):
+        decoder.feed('[3]')
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 65536])
+def test_iterparse(chunk_size, monkeypatch):
+    """test_iterparse function.
+
+    Checks that JsonDecoder.iterparse yields the events of the first
+    object in text read by chunks, and build_items builds array items
+    from them.
+    """
+    monkeypatch.setattr(decoder_module, '_CHUNK_SIZE', chunk_size)
+    text = '[{"a": [1, "b"]}, true, null, -0.5, []] {}'
+    events = JsonDecoder().iterparse(io.StringIO(text))
+    assert list(events) == [
+        ('start_array', None), ('start_map', None), ('map_key', 'a'),
+        ('start_array', None), ('number', 1), ('string', 'b'),
+        ('end_array', None), ('end_map', None), ('boolean', True),
+        ('null', None), ('number', -0.5), ('start_array', None),
+        ('end_array', None), ('end_array', None)
+    ]
+    events = JsonDecoder().iterparse(io.StringIO(text))
+    assert next(events) == ('start_array', None)
+    assert list(build_items(events)) == json.loads(text[:text.index(' {')])
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 5, 65536])
+def test_scanner(chunk_size, monkeypatch):
+    """test_scanner function.
+
+    Checks that JsonScanner skips values, including strs with brackets
+    and escaped quotes and deeply nested containers, and decodes values
+    following them in text read by chunks.
+    """
+    monkeypatch.setattr(decoder_module, '_CHUNK_SIZE', chunk_size)
+    deep = '[{"a": ' * 15 + '"]}\\""' + '}]' * 15
+    text = ('{"skip": [1, {"x": "]}\\"[{"}], "deep": ' + deep +
+            ', "s": "a\\"b", "n": -1.5, "keep": [true, "y"]}')
+    scanner = JsonScanner(io.StringIO(text))
+    assert scanner.enter() == '{'
+    keys = []
+    while (key := scanner.next_key()) != 'keep':
+        keys.append(key)
+        scanner.skip()
+    assert keys == ['skip', 'deep', 's', 'n']
+    assert scanner.enter() == '['
+    assert scanner.next_item()
+    assert scanner.decode_next() is True
+    assert scanner.next_item()
+    assert scanner.decode_next() == 'y'
+    assert not scanner.next_item()
+    assert scanner.next_key() is None
+    assert scanner.peek() == ''
+    with pytest.raises(ValueError):
+        JsonScanner('[[1, 2]').skip()
@@ -5,13 +5,19 @@ It targets testing myserializer module:
 - Checking if create_serializer returns an instance of Serializer
 for valid inputs;
 - Checking if create_serializer raises NotImplementedError for those
-formats that are not expected to be implemented.
+formats that are not expected to be implemented;
+- Checking if formats are registered and imported on first use.
 """
+import importlib.metadata
 import random
+import subprocess
+import sys
 from typing import List
 
+import myserializer
 import pytest
-from myserializer import create_serializer
+from myserializer import create_serializer, register_serializer
+from myserializer.my_json import JsonSerializer
 from myserializer.serializer import Serializer
 
 from serialization_options import implemented_formats as implemented
@@ -73,3 +79,58 @@ def test_not_implemented(serializer_type):
     """
     with pytest.raises(NotImplementedError):
         create_serializer(serializer_type)
+
+
+def test_lazy_imports():
+    """test_lazy_imports function.
+
+    Checks that importing myserializer does not import format modules
+    and their backends, and creating a serializer imports only its own.
+    """
+    code = ('import sys, myserializer\n'
+            'assert "yaml" not in sys.modules\n'
+            'assert "myserializer.packer" not in sys.modules\n'
+            'myserializer.create_serializer("json")\n'
+            'assert "myserializer.my_json" in sys.modules\n'
+            'assert "toml" not in sys.modules\n'
+            'assert "gzip" not in sys.modules\n')
+    subprocess.run([sys.executable, '-c', code], check=True)
+    assert myserializer.JsonSerializer is JsonSerializer
+    with pytest.raises(AttributeError):
+        myserializer.NoSerializer
+
+
+def test_register_serializer(monkeypatch):
+    """test_register_serializer function.
+
+    Checks that serializer types are registered by factories, by paths
+    imported on first use and by entry points, which do not replace
+    registered types.
+    """
+    monkeypatch.setattr(myserializer, '_SERIALIZERS',
+                        dict(myserializer._SERIALIZERS))
+    monkeypatch.setattr(myserializer, '_entry_points_loaded', False)
+    register_serializer('Plain', lambda: JsonSerializer(plain=True))
+    assert create_serializer('plain').packer.plain
+    register_serializer('json2', 'myserializer.my_json:JsonSerializer')
+    assert type(create_serializer('JSON2')) is JsonSerializer
+
+    entry_points = [
+        importlib.metadata.EntryPoint(
+            'ep', 'myserializer.my_binary:BinarySerializer',
+            myserializer.ENTRY_POINT_GROUP),
+        importlib.metadata.EntryPoint(
+            'json', 'myserializer.my_yaml:YamlSerializer',
+            myserializer.ENTRY_POINT_GROUP)
+    ]
+    if sys.version_info >= (3, 10):
+        def fake_entry_points(group):
+            assert group == myserializer.ENTRY_POINT_GROUP
+            return entry_points
+    else:
+        def fake_entry_points():
+            return {myserializer.ENTRY_POINT_GROUP: entry_points}
+    monkeypatch.setattr(importlib.metadata, 'entry_points',
+                        fake_entry_points)
+    assert create_serializer('ep').binary
+    assert type(create_serializer('json')) is JsonSerializer
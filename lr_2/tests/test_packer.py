@@ -4,8 +4,17 @@ This module provides a number of tests to be used by PyTest.
 It targets testing myserializer.packer module:
 - Checking if object after being repacked does not change type and value.
 """
+import copy
+import marshal
+import math
+import pickle
+import struct
+from array import array
+from base64 import b64encode
+from types import ModuleType
+
 import pytest
-from myserializer.packer import Packer
+from myserializer.packer import ConstantNode, Packer
 
 from serialization_inputs import test_basic
 
@@ -36,3 +45,428 @@ def test_packing(test_input):
     repacked = pack_unpack(test_input, packer)
     assert type(repacked) == type(test_input)
     assert repacked == test_input
+
+
+class _ModuleSubclass(ModuleType):
+    pass
+
+
+class _StrSubclass(str):
+    pass
+
+
+@pytest.mark.parametrize('test_input,expected', [
+    (_ModuleSubclass('math'), math), (math, math)
+])
+def test_packing_module_subclass(test_input, expected):
+    """test_packing_module_subclass function.
+
+    Checks that modules of types derived from ModuleType are packed
+    as modules and unpacked by name.
+    """
+    packer = Packer()
+    assert pack_unpack(test_input, packer) is expected
+
+
+@pytest.mark.parametrize('test_input', [
+    _StrSubclass('abc'), object(), [1, {'a': Exception}]
+])
+def test_not_packable(test_input):
+    """test_not_packable function.
+
+    Checks that packing objects of unsupported types (including
+    subclasses of supported types) raises NotImplementedError.
+    """
+    with pytest.raises(NotImplementedError):
+        Packer().pack(test_input)
+
+
+@pytest.mark.parametrize('depth', [1000, 100000])
+def test_deep_nesting(depth):
+    """test_deep_nesting function.
+
+    Checks that deeply nested lists, tuples and dicts can be repacked
+    without reaching the recursion limit.
+    """
+    test_input: list = []
+    for level in range(depth):
+        test_input = [({level: test_input},)]
+    packer = Packer()
+    repacked = pack_unpack(test_input, packer)
+    for level in reversed(range(depth)):
+        assert type(repacked) is list
+        repacked = repacked[0][0][level]
+    assert repacked == []
+
+
+def _get_nested_func():
+    c = 5
+
+    def f(x=(1,)):
+        """Doc."""
+        return x, c
+    return f
+
+
+def test_packed_tree():
+    """test_packed_tree function.
+
+    Checks that a nested input containing a function with a closure cell
+    and a dict with container keys is packed into the expected tree.
+    """
+    func = _get_nested_func()
+    code = b64encode(marshal.dumps(func.__code__)).decode()
+    test_input = [{(1, 'a'): [None], frozenset(): func}]
+    assert Packer().pack(test_input) == {
+        'type': 'list', 'value': [
+            {'type': 'dict', 'value': [
+                {'type': 'tuple', 'value': [
+                    {'type': 'tuple', 'value': [
+                        {'type': 'int', 'value': '1'},
+                        {'type': 'str', 'value': 'a'}]},
+                    {'type': 'list', 'value': [{'type': 'None'}]}]},
+                {'type': 'tuple', 'value': [
+                    {'type': 'frozenset', 'value': []},
+                    {'type': 'function',
+                     'doc': {'type': 'str', 'value': 'Doc.'},
+                     'name': {'type': 'str', 'value': 'f'},
+                     'code': {'type': 'bytes', 'value': code},
+                     'defaults': {'type': 'tuple', 'value': [
+                         {'type': 'tuple', 'value': [
+                             {'type': 'int', 'value': '1'}]}]},
+                     'closure': {'type': 'tuple', 'value': [
+                         {'type': 'cell',
+                          'value': {'type': 'int', 'value': '5'}}]}}]}]}]}
+
+
+@pytest.mark.parametrize('test_input', test_basic)
+def test_plain_packing(test_input):
+    """test_plain_packing function.
+
+    Checks that an object after pack_unpack in plain mode does not change:
+    - type;
+    - value.
+    """
+    packer = Packer(plain=True)
+    repacked = pack_unpack(test_input, packer)
+    assert type(repacked) == type(test_input)
+    assert repacked == test_input
+
+
+def test_plain_packed_tree():
+    """test_plain_packed_tree function.
+
+    Checks that JSON-compatible data is packed in plain mode as itself,
+    and that other objects are tagged.
+    """
+    data = {'a': [1, 2.5, None, True, 'x'], 'b': {'c': []}}
+    assert Packer(plain=True).pack(data) == data
+    test_input = [(1,), {1: 'a'}, {'type': 'a'}, 2 ** 60, math.inf, data]
+    packed = Packer(plain=True).pack(test_input)
+    assert packed == [
+        {'type': 'tuple', 'value': [1]},
+        {'type': 'dict', 'value': [{'type': 'tuple', 'value': [1, 'a']}]},
+        {'type': 'dict', 'value': [
+            {'type': 'tuple', 'value': ['type', 'a']}]},
+        {'type': 'int', 'value': str(2 ** 60)},
+        {'type': 'float', 'value': 'inf'},
+        data]
+
+
+def test_plain_shared_references():
+    """test_plain_shared_references function.
+
+    Checks that plain lists and dicts are referenced
+    in the same way as tagged containers.
+    """
+    shared = {'key': [1]}
+    test_input = [shared, ({'x': shared},), shared['key']]
+    packer = Packer(plain=True)
+    packed = packer.pack(test_input)
+    assert packed[1]['value'][0]['x'] == {'type': 'ref', 'value': '1'}
+    assert packed[2] == {'type': 'ref', 'value': '2'}
+    repacked = packer.unpack(packed)
+    assert repacked == test_input
+    assert repacked[1][0]['x'] is repacked[0]
+    assert repacked[2] is repacked[0]['key']
+    repacked = pack_unpack(_self_referencing_list(), packer)
+    assert repacked[1][0] is repacked
+
+
+@pytest.mark.parametrize('test_input,expected', [
+    (2 ** 64 - 1, str(2 ** 64 - 1)), (-2 ** 64 + 1, str(-2 ** 64 + 1)),
+    (2 ** 64, '0x10000000000000000'), (-31 << 70, '-0x7c' + '0' * 17)
+])
+def test_packed_ints(test_input, expected):
+    """test_packed_ints function.
+
+    Checks that ints which do not fit into 64 bits are packed in hex.
+    """
+    packed = Packer().pack(test_input)
+    assert packed == {'type': 'int', 'value': expected}
+    assert Packer().unpack(packed) == test_input
+
+
+def test_constant_nodes():
+    """test_constant_nodes function.
+
+    Checks that None, bools, small ints and the empty str are packed
+    as shared constant nodes, which cannot be modified but can be copied.
+    """
+    test_input = [None, True, False, -5, 256, '']
+    packed = Packer().pack(test_input)
+    repacked = Packer().pack(test_input)
+    for node, other in zip(packed['value'], repacked['value']):
+        assert type(node) is ConstantNode
+        assert node is other
+    assert packed['value'] == [
+        {'type': 'None'}, {'type': 'bool', 'value': 'True'},
+        {'type': 'bool', 'value': 'False'}, {'type': 'int', 'value': '-5'},
+        {'type': 'int', 'value': '256'}, {'type': 'str', 'value': ''}]
+    for test_input in (-6, 257, 'a'):
+        assert type(Packer().pack(test_input)) is dict
+    node = packed['value'][1]
+    for modify in (lambda: node.update(value='False'), node.clear,
+                   lambda: node.setdefault('a'), lambda: node.pop('type'),
+                   node.popitem, lambda: node.__setitem__('value', 'no'),
+                   lambda: node.__delitem__('value'),
+                   lambda: node.__ior__({})):
+        with pytest.raises(TypeError):
+            modify()
+    assert node == {'type': 'bool', 'value': 'True'}
+    for node_copy in (dict(node), node.copy()):
+        node_copy['value'] = 'False'
+        assert type(node_copy) is dict
+    for node_copy in (copy.copy(node), copy.deepcopy(node),
+                      pickle.loads(pickle.dumps(node))):
+        assert node_copy == node
+    assert Packer(plain=True).unpack(packed) == \
+        [None, True, False, -5, 256, '']
+
+
+def test_typed_arrays():
+    """test_typed_arrays function.
+
+    Checks that long lists of ints or floats and arrays are packed
+    as typed array nodes, and that other lists are not.
+    """
+    packer = Packer()
+    ints = list(range(16))
+    packed = packer.pack(ints)
+    assert packed == {'type': 'list', 'dtype': 'q', 'value': b64encode(
+        struct.pack('<16q', *ints)).decode()}
+    packed = packer.pack([0.5] * 16)
+    assert packed == {'type': 'list', 'dtype': 'd', 'value': b64encode(
+        struct.pack('<d', 0.5) * 16).decode()}
+    packed = packer.pack(array('h', [1, -2]))
+    assert packed == {'type': 'array', 'dtype': 'h',
+                      'value': b64encode(struct.pack('<2h', 1, -2)).decode()}
+    for test_input in (ints[:15], ints + [0.5], ints + [2 ** 63]):
+        assert 'dtype' not in packer.pack(test_input)
+    repacked = pack_unpack([ints, ints], packer)
+    assert repacked == [ints, ints]
+    assert repacked[0] is repacked[1]
+
+
+@pytest.mark.parametrize('encoding', ['base64', 'base85', 'raw'])
+@pytest.mark.parametrize('test_input', [
+    b'', b'\x00\xff bytes', bytearray(b'\x01' * 100),
+    memoryview(array('d', [0.5, -1.5])), memoryview(b'abcdef')[::2]
+])
+def test_bytes_encodings(test_input, encoding):
+    """test_bytes_encodings function.
+
+    Checks that bytes-like objects are packed into one node
+    and repacked with all supported encodings; raw data is kept
+    as bytes.
+    """
+    packer = Packer(bytes_encoding=encoding)
+    packed = packer.pack(test_input)
+    assert type(packed['value']) is (bytes if encoding == 'raw' else str)
+    assert ('encoding' in packed) == (encoding != 'base64')
+    repacked = packer.unpack(packed)
+    assert type(repacked) == type(test_input)
+    assert repacked == test_input
+
+
+def test_unpack_nested_bytes():
+    """test_unpack_nested_bytes function.
+
+    Checks that bytes packed with their base64 in a str node are unpacked.
+    """
+    packed = {'type': 'bytearray',
+              'value': {'type': 'str', 'value': b64encode(b'ab').decode()}}
+    assert Packer().unpack(packed) == bytearray(b'ab')
+
+
+def test_unknown_bytes_encoding():
+    """test_unknown_bytes_encoding function.
+
+    Checks that unknown bytes encodings raise ValueError.
+    """
+    with pytest.raises(ValueError):
+        Packer(bytes_encoding='hex')
+    with pytest.raises(ValueError):
+        Packer().unpack({'type': 'bytes', 'value': '', 'encoding': 'hex'})
+
+
+def test_code_cache():
+    """test_code_cache function.
+
+    Checks that code objects of functions packed and unpacked repeatedly
+    are taken from the code caches, which keep at most maxsize items.
+    """
+    func = _get_nested_func()
+    packer = Packer(code_cache_size=1)
+    packed = packer.pack(func)
+    assert packer.pack(func) == packed
+    assert packer.unpack(packed)(1) == packer.unpack(packed)(1) == func(1)
+    assert packer.code_cache_info() == ((1, 1, 1, 1), (1, 1, 1, 1))
+    packer.pack(_recursive_func())
+    packer.pack(func)
+    assert packer.code_cache_info().pack == (1, 3, 1, 1)
+    packer.bytes_encoding = 'base85'
+    repacked = pack_unpack(func, packer)
+    assert repacked(1) == func(1)
+    assert packer.code_cache_info() == ((1, 4, 1, 1), (1, 2, 1, 1))
+    packer.code_cache_clear()
+    assert packer.code_cache_info() == ((0, 0, 1, 0), (0, 0, 1, 0))
+    packer = Packer(code_cache_size=0)
+    assert packer.pack(func) == packer.pack(func) == packed
+    assert packer.code_cache_info() == ((0, 2, 0, 0), (0, 0, 0, 0))
+
+
+def test_shared_references():
+    """test_shared_references function.
+
+    Checks that an object met several times is packed once
+    and stays shared after unpacking.
+    """
+    shared = {'key': [1, 2, 3]}
+    test_input = [shared, (shared, shared['key']), shared]
+    packer = Packer()
+    packed = packer.pack(test_input)
+    assert packed['value'][2] == {'type': 'ref', 'value': '1'}
+    repacked = packer.unpack(packed)
+    assert repacked == test_input
+    assert repacked[0] is repacked[1][0] is repacked[2]
+    assert repacked[1][1] is repacked[0]['key']
+
+
+def _self_referencing_list():
+    test_input: list = [1]
+    test_input.append([test_input])
+    return test_input
+
+
+def _self_referencing_dict():
+    test_input: dict = {'a': 1}
+    test_input['self'] = (test_input,)
+    return test_input
+
+
+def _list_referencing_tuple():
+    test_input = ([],)
+    test_input[0].append(test_input)
+    return test_input
+
+
+def _recursive_func():
+    def fact(n):
+        return 1 if n <= 1 else n * fact(n - 1)
+    return fact
+
+
+def test_reference_cycles():
+    """test_reference_cycles function.
+
+    Checks that objects containing themselves are repacked
+    with their structure preserved.
+    """
+    packer = Packer()
+    repacked = pack_unpack(_self_referencing_list(), packer)
+    assert repacked[1][0] is repacked
+    repacked = pack_unpack(_self_referencing_dict(), packer)
+    assert repacked['self'][0] is repacked
+    repacked = pack_unpack(_list_referencing_tuple(), packer)
+    assert repacked[0][0] is repacked
+    repacked = pack_unpack(_recursive_func(), packer)
+    assert repacked(5) == 120
+
+
+@pytest.mark.parametrize('test_input', [
+    {'type': 'tuple', 'value': [{'type': 'ref', 'value': '0'}]},
+    {'type': 'list', 'value': [{'type': 'ref', 'value': '1'}]},
+    {'type': 'dict', 'value': [{'type': 'tuple', 'value': [
+        {'type': 'ref', 'value': '1'}, {'type': 'None'}]}]},
+])
+def test_invalid_references(test_input):
+    """test_invalid_references function.
+
+    Checks that references which cannot be resolved raise ValueError.
+    """
+    with pytest.raises(ValueError):
+        Packer().unpack(test_input)
+
+
+def test_unpack_list_pairs():
+    """test_unpack_list_pairs function.
+
+    Checks that items of a packed dict may be any packed pairs.
+    """
+    packed = {'type': 'dict', 'value': [
+        {'type': 'list', 'value': [{'type': 'str', 'value': 'a'},
+                                   {'type': 'int', 'value': '1'}]}]}
+    assert Packer().unpack(packed) == {'a': 1}
+
+
+@pytest.mark.parametrize('test_input', [
+    {'type': 'nope'}, {'type': 'list', 'value': [{'type': 'NoneType'}]},
+    {'type': 'dict', 'value': [{'type': 'tuple', 'value': [
+        {'type': 'str', 'value': 'a'}, {'type': 'unknown'}]}]}
+])
+def test_not_unpackable(test_input):
+    """test_not_unpackable function.
+
+    Checks that unpacking nodes of unknown type raises NotImplementedError.
+    """
+    with pytest.raises(NotImplementedError):
+        Packer().unpack(test_input)
+
+
+@pytest.mark.parametrize('test_input', [
+    'a', 1, None, [], {'a': 'b'}, {'type': 'list', 'value': ['a']}
+])
+def test_plain_not_unpackable(test_input):
+    """test_plain_not_unpackable function.
+
+    Checks that plain nodes cannot be unpacked if plain mode is off.
+    """
+    with pytest.raises(Exception):
+        Packer().unpack(test_input)
+
+
+def test_unpack_items():
+    """test_unpack_items function.
+
+    Checks that Packer.unpack_items unpacks items of a packed list
+    one by one, resolving references to objects of other items
+    only if shared is True.
+    """
+    shared = [1]
+    test_input = [{'a': shared, 'b': shared}, (2, [3]), shared]
+    packer = Packer()
+    nodes = packer.pack(test_input)['value']
+    items = list(packer.unpack_items(nodes))
+    assert items == test_input
+    assert items[0]['a'] is items[0]['b'] is items[2]
+    items = packer.unpack_items(packer.pack(test_input)['value'], False)
+    first = next(items)
+    assert first == test_input[0] and first['a'] is first['b']
+    assert next(items) == test_input[1]
+    with pytest.raises(ValueError):
+        next(items)
+    looped: list = []
+    looped.append([looped])
+    with pytest.raises(ValueError):
+        list(packer.unpack_items(packer.pack(looped)['value']))
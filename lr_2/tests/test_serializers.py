@@ -12,10 +12,15 @@ from types import FunctionType
 from typing import List, Tuple
 
 import pytest
+from myserializer.my_json import JsonSerializer
+from myserializer.my_json.encoder import JsonEncoder
+from myserializer.my_toml import TomlSerializer
+from myserializer.my_yaml import YamlSerializer
 from myserializer.serializer import Serializer
 
 from serialization_inputs import test_basic, test_funcs_with_args
-from serialization_options import serializers
+from serialization_options import (compressed_serializers, plain_serializers,
+                                   serializers)
 
 
 def dumps_loads(item, serializer: Serializer):
@@ -35,7 +40,8 @@ def dump_load(item, serializer: Serializer):
     Serializes item by calling serializer.dump
     and returns result of serializer.load.
     """
-    with io.StringIO() as serialization_stream:
+    stream_type = io.BytesIO if serializer.binary else io.StringIO
+    with stream_type() as serialization_stream:
         serializer.dump(item, serialization_stream)
         serialization_stream.flush()
         serialization_stream.seek(0)
@@ -44,7 +50,8 @@ def dump_load(item, serializer: Serializer):
 
 
 @pytest.mark.parametrize('test_input', test_basic)
-@pytest.mark.parametrize('serializer', serializers)
+@pytest.mark.parametrize('serializer', serializers + plain_serializers
+                         + compressed_serializers)
 @pytest.mark.parametrize('cycle_serialization', [dumps_loads, dump_load])
 def test_basic_serialization(test_input, serializer: Serializer,
                              cycle_serialization: FunctionType):
@@ -86,8 +93,244 @@ def test_not_unpackable(test_input, serializer: Serializer):
         serializer.loads(test_input)
 
 
-@pytest.mark.parametrize('test_func,test_args', test_funcs_with_args)
 @pytest.mark.parametrize('serializer', serializers)
+def test_shared_constant_nodes(serializer: Serializer):
+    """test_shared_constant_nodes function.
+
+    Checks that shared constant nodes are not serialized as aliases.
+    """
+    test_input = [None, True, 0, None, True, 0]
+    serialized = serializer.dumps(test_input)
+    if not serializer.binary:
+        assert '&' not in serialized
+    assert serializer.loads(serialized) == test_input
+
+
+@pytest.mark.parametrize('test_input,expected', [
+    ([1, 'a', None], '[1,"a",null]'),
+    ({'a': [True, 2.5]}, '{"a":[true,2.5]}'),
+    ((1,), '{"type":"tuple","value":[1]}')
+])
+@pytest.mark.parametrize('serializer', plain_serializers)
+def test_plain_serialization(test_input, expected: str,
+                             serializer: Serializer):
+    """test_plain_serialization function.
+
+    Checks that JSON-compatible data is serialized in plain mode
+    as ordinary JSON, and that other objects are tagged.
+    """
+    assert serializer.dumps(test_input) == expected
+    assert serializer.loads(expected) == test_input
+
+
+@pytest.mark.parametrize('test_input', test_basic + [
+    func for func, _ in test_funcs_with_args] + [test_basic])
+@pytest.mark.parametrize('plain', [False, True])
+def test_fused_json_dump(test_input, plain: bool):
+    """test_fused_json_dump function.
+
+    Checks that JsonSerializer, which encodes objects while packing them,
+    writes the same text as encoding the result of Packer.pack.
+    """
+    serializer = JsonSerializer(plain=plain)
+    expected = JsonEncoder().encode(serializer.packer.pack(test_input))
+    assert serializer.dumps(test_input) == expected
+
+
+@pytest.mark.parametrize('test_input', [
+    [], [1, 'a', None, [2.5, (3,)], {'k': {'v'}}, b'\x00'],
+    list(range(100)), [[0.5] * 20, [1] * 20],
+    [[[1, 2]] * 3, {'a': (), 'b': ()}], [()] * 3
+])
+@pytest.mark.parametrize('plain', [False, True])
+def test_load_items(test_input, plain: bool):
+    """test_load_items function.
+
+    Checks that JsonSerializer.load_items yields the items of
+    a serialized list, including typed arrays and shared objects.
+    """
+    serializer = JsonSerializer(plain=plain)
+    with io.StringIO(serializer.dumps(test_input)) as stream:
+        items = serializer.load_items(stream)
+        assert list(items) == test_input
+    if test_input[-1:] != [()]:
+        with io.StringIO(serializer.dumps(test_input)) as stream:
+            items = serializer.load_items(stream, shared=False)
+            assert list(items) == test_input
+
+
+@pytest.mark.parametrize('test_input', [
+    {'a': 1}, (1, 2), 'list', [()] * 2
+])
+@pytest.mark.parametrize('plain', [False, True])
+def test_load_items_errors(test_input, plain: bool):
+    """test_load_items_errors function.
+
+    Checks that JsonSerializer.load_items raises ValueError if
+    the object is not a list or its items share objects while
+    shared is False.
+    """
+    serializer = JsonSerializer(plain=plain)
+    with io.StringIO(serializer.dumps(test_input)) as stream:
+        with pytest.raises(ValueError):
+            list(serializer.load_items(stream, shared=False))
+
+
+_SHARED = (1, 2)
+_LOAD_AT_INPUT = {
+    'users': [{'name': 'a', 'tags': _SHARED}, {'name': 'b', 'tags': _SHARED}],
+    1: {'x': [1] * 20, 'y': 'z'}, 'set': {1, 2}, 'type': 'str',
+    'deep': {'k': [[0, {'z': 'found'}]]}
+}
+
+
+@pytest.mark.parametrize('path', [
+    (), ('users', 0, 'name'), ('users', 1, 'name'), ('users', 1, 'tags'),
+    (1, 'x', 19), (1, 'y'), ('set',), ('type',), ('deep', 'k', 0, 1, 'z'),
+    ('users', -1, 'tags', 0)
+])
+@pytest.mark.parametrize('plain', [False, True])
+def test_load_at(path: tuple, plain: bool):
+    """test_load_at function.
+
+    Checks that JsonSerializer.load_at gets the same object as indexing
+    the loaded object, including objects referencing objects packed
+    elsewhere.
+    """
+    serializer = JsonSerializer(plain=plain)
+    expected = _LOAD_AT_INPUT
+    for key in path:
+        expected = expected[key]
+    text = serializer.dumps(_LOAD_AT_INPUT)
+    assert serializer.loads_at(text, path) == expected
+
+
+@pytest.mark.parametrize('path,error', [
+    (('nokey',), KeyError), (('users', 5), IndexError),
+    (('users', 0, 'x'), KeyError), (('deep', 'k', 1), IndexError)
+])
+@pytest.mark.parametrize('plain', [False, True])
+def test_load_at_errors(path: tuple, error: type, plain: bool):
+    """test_load_at_errors function.
+
+    Checks that JsonSerializer.load_at raises KeyError and IndexError
+    if there is no object at the path, and ValueError if the object
+    references objects packed elsewhere but IO is not seekable.
+    """
+    serializer = JsonSerializer(plain=plain)
+    text = serializer.dumps(_LOAD_AT_INPUT)
+    with pytest.raises(error):
+        serializer.loads_at(text, path)
+
+    class Unseekable(io.StringIO):
+        def seekable(self):
+            return False
+
+    with pytest.raises(ValueError):
+        serializer.load_at(Unseekable(text), ('users', 1, 'tags'))
+
+
+@pytest.mark.parametrize('plain', [False, True])
+def test_dump_iter(plain: bool):
+    """test_dump_iter function.
+
+    Checks that JsonSerializer.load_iter loads the objects written by
+    dump_iter one per line, including appended ones, and raises
+    ValueError if the last document is incomplete.
+    """
+    serializer = JsonSerializer(plain=plain)
+    test_input = test_basic + [test_basic]
+    with io.StringIO() as stream:
+        serializer.dump_iter(test_input, stream)
+        serializer.dump_iter(iter([1, 'a']), stream)
+        text = stream.getvalue()
+    assert text.count('\n') == len(test_input) + 2
+    with io.StringIO(text) as stream:
+        assert list(serializer.load_iter(stream)) == test_input + [1, 'a']
+    with io.StringIO(text[:-3]) as stream:
+        objs = serializer.load_iter(stream)
+        assert next(objs) == test_input[0]
+        with pytest.raises(ValueError):
+            list(objs)
+
+
+@pytest.mark.parametrize('flow_style', [False, None, True])
+def test_yaml_flow_style(flow_style: 'bool | None'):
+    """test_yaml_flow_style function.
+
+    Checks that YamlSerializer loads objects dumped in any flow style,
+    and that flow style output takes fewer lines.
+    """
+    serializer = YamlSerializer(flow_style=flow_style)
+    text = serializer.dumps(test_basic)
+    assert serializer.loads(text) == test_basic
+    block_text = YamlSerializer().dumps(test_basic)
+    if flow_style is not False:
+        assert text.count('\n') < block_text.count('\n')
+        assert len(text) < len(block_text)
+
+
+@pytest.mark.parametrize('flow_style', [False, None])
+def test_yaml_dump_all(flow_style: 'bool | None'):
+    """test_yaml_dump_all function.
+
+    Checks that YamlSerializer.load_all loads the documents written
+    by dump_all one by one.
+    """
+    serializer = YamlSerializer(flow_style=flow_style)
+    with io.StringIO() as stream:
+        serializer.dump_all(iter(test_basic), stream)
+        text = stream.getvalue()
+    assert text.count('\n---') == len(test_basic) - 1
+    with io.StringIO(text) as stream:
+        objs = serializer.load_all(stream)
+        assert next(objs) == test_basic[0]
+        assert list(objs) == test_basic[1:]
+
+
+@pytest.mark.parametrize('test_input', [
+    {'a': ['\u1337\U0001f600', 1.5]}, [], ''
+])
+@pytest.mark.parametrize('plain', [False, True])
+def test_load_path(test_input, plain: bool, tmp_path):
+    """test_load_path function.
+
+    Checks that JsonSerializer.load_path loads objects from
+    memory-mapped files, and that empty files cannot be decoded.
+    """
+    serializer = JsonSerializer(plain=plain)
+    path = tmp_path / 'obj.json'
+    path.write_text(serializer.dumps(test_input), encoding='utf-8')
+    assert serializer.load_path(path) == test_input
+    path.write_bytes(b'')
+    with pytest.raises(ValueError):
+        serializer.load_path(str(path))
+
+
+def test_toml_flat_layout():
+    """test_toml_flat_layout function.
+
+    Checks that TomlSerializer writes no nested table headers,
+    that its TOML is loaded by the parser of the toml package too,
+    and that TOML written by the toml package is loaded.
+    """
+    toml = pytest.importorskip('toml')
+    serializer = TomlSerializer()
+    for test_input in test_basic:
+        text = serializer.dumps(test_input)
+        headers = {line for line in text.splitlines()
+                   if line.startswith('[')}
+        assert headers <= {'[[value]]'}
+        assert serializer.packer.unpack(toml.loads(text)) == test_input
+    test_input = {'a': [1, (2.5, None)], 'b c': {'d': b'e'}}
+    text = toml.dumps(serializer.packer.pack(test_input))
+    assert '[[value.value]]' in text
+    assert serializer.loads(text) == test_input
+
+
+@pytest.mark.parametrize('test_func,test_args', test_funcs_with_args)
+@pytest.mark.parametrize('serializer', serializers + plain_serializers
+                         + compressed_serializers)
 @pytest.mark.parametrize('cycle_serialization', [dumps_loads, dump_load])
 def test_function_serialization(test_func: FunctionType,
                                 test_args: List[Tuple],